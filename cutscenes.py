@@ -1,11 +1,14 @@
 """Story cutscene definitions for Cosmogenesis."""
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 import random
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pygame
 from OpenGL import GL as gl
 
@@ -13,14 +16,333 @@ Vec2 = Tuple[float, float]
 Vec3 = Tuple[float, float, float]
 
 
-@dataclass
-class Star:
-    """Single star used for the backdrop of the opening cutscene."""
+def _draw_vertex_array(
+    mode: int, positions: Sequence[float], colors: Sequence[int]
+) -> None:
+    """Submit interleaved 2D vertices and 8-bit colors in one draw call.
 
-    position: Vec2
-    base_brightness: float
-    twinkle_speed: float
-    phase: float
+    ``positions`` is a flat ``x0, y0, x1, y1, ...`` sequence and ``colors`` a
+    flat ``r, g, b, a`` byte sequence of matching length. Batching through
+    ``glDrawArrays`` replaces hundreds of per-vertex ``glVertex2f`` /
+    ``glColor4f`` FFI crossings with a single submission.
+    """
+
+    count = len(positions) // 2
+    if count == 0:
+        return
+    gl.glVertexPointer(2, gl.GL_FLOAT, 0, np.asarray(positions, dtype=np.float32))
+    gl.glColorPointer(4, gl.GL_UNSIGNED_BYTE, 0, np.asarray(colors, dtype=np.uint8))
+    gl.glDrawArrays(mode, 0, count)
+
+
+def _enable_vertex_arrays() -> None:
+    """Turn on the client vertex/colour arrays for a frame of array draws.
+
+    Every draw in this module funnels through ``glDrawArrays``, so the
+    enable/disable pair happens once per frame rather than per submission.
+    """
+
+    gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+    gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+
+
+def _disable_vertex_arrays() -> None:
+    gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+    gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+
+
+@lru_cache(maxsize=8)
+def _unit_disk(step_degrees: int) -> np.ndarray:
+    """Triangulated unit disk (fan around the origin) as an ``(M, 2)`` array.
+
+    Scaling and offsetting this template replaces the per-vertex Python
+    loops the circle fans used to run; every disk becomes one vectorized
+    multiply-add.
+    """
+
+    ring = np.asarray(_unit_circle(step_degrees), dtype=np.float32)
+    triangles = np.zeros((len(ring) - 1, 3, 2), dtype=np.float32)
+    triangles[:, 1] = ring[:-1]
+    triangles[:, 2] = ring[1:]
+    disk = triangles.reshape(-1, 2)
+    disk.setflags(write=False)
+    return disk
+
+
+@lru_cache(maxsize=8)
+def _unit_circle(step_degrees: int) -> Tuple[Tuple[float, float], ...]:
+    """Memoized ``(cos, sin)`` table for ``range(0, 361, step)`` fan loops.
+
+    The fan and glow loops only ever sample fixed angular steps, so the
+    radians conversion and both trig calls per vertex collapse into a table
+    lookup shared by every frame.
+    """
+
+    angles = np.deg2rad(np.arange(0, 360, step_degrees))
+    table = tuple(zip(np.cos(angles).tolist(), np.sin(angles).tolist()))
+    # Close the loop by reusing the 0-degree entry instead of evaluating the
+    # trig again at 360 degrees.
+    return table + (table[0],)
+
+
+# Unit offsets for the reporter's wobbled hair outline. The wobble applies
+# sin to the raw degree value (preserved from the original), and folding it
+# into the circle table leaves just a multiply-add per vertex.
+_REPORTER_HAIR_OFFSETS = tuple(
+    (cos_a * 1.15, sin_a * 1.25 * (1.0 + 0.2 * math.sin(angle * 2.0)))
+    for angle, (cos_a, sin_a) in zip(range(0, 361, 15), _unit_circle(15))
+)
+
+
+def _rgba8(r: float, g: float, b: float, a: float) -> Tuple[int, int, int, int]:
+    """Convert float RGBA in [0, 1] to the byte tuple the batchers consume."""
+
+    return (
+        int(min(1.0, max(0.0, r)) * 255),
+        int(min(1.0, max(0.0, g)) * 255),
+        int(min(1.0, max(0.0, b)) * 255),
+        int(min(1.0, max(0.0, a)) * 255),
+    )
+
+
+class _PrimitiveBatch:
+    """Accumulates triangulated 2D geometry and flushes it in a few draw calls.
+
+    Quads, fans, and polygons are triangulated up front and consecutive
+    same-mode primitives merge into one GL_TRIANGLES or GL_LINES submission.
+    This replaces the dozens of tiny glBegin/glEnd pairs the scene helpers
+    used to issue with a handful of GL calls per frame. The scene renderers
+    lean on the painter's algorithm with depth testing off, so flush()
+    replays runs in submission order rather than sorting fills before
+    wireframes — an occluded face's outline must stay under nearer fills.
+    """
+
+    def __init__(self) -> None:
+        # array.array gives contiguous typed storage, so flush() hands the
+        # GL a buffer directly instead of converting a Python list element
+        # by element.
+        self._tri_positions = array("f")
+        self._tri_colors = array("B")
+        self._line_positions = array("f")
+        self._line_colors = array("B")
+        # Submission-ordered runs of (mode, end float index) into the mode's
+        # position array; colors end at twice the index (4 bytes vs 2 floats
+        # per vertex).
+        self._runs: List[List[int]] = []
+
+    def _mark(self, mode: int, end: int) -> None:
+        runs = self._runs
+        if runs and runs[-1][0] == mode:
+            runs[-1][1] = end
+        else:
+            runs.append([mode, end])
+
+    def add_triangle(
+        self, p0: Vec2, p1: Vec2, p2: Vec2, rgba: Tuple[int, int, int, int]
+    ) -> None:
+        self._tri_positions.extend((p0[0], p0[1], p1[0], p1[1], p2[0], p2[1]))
+        self._tri_colors.extend(rgba * 3)
+        self._mark(gl.GL_TRIANGLES, len(self._tri_positions))
+
+    def add_quad(
+        self, corners: Sequence[Vec2], rgba: Tuple[int, int, int, int]
+    ) -> None:
+        self.add_triangle(corners[0], corners[1], corners[2], rgba)
+        self.add_triangle(corners[0], corners[2], corners[3], rgba)
+
+    def add_quad_shaded(
+        self,
+        corners: Sequence[Vec2],
+        rgbas: Sequence[Tuple[int, int, int, int]],
+    ) -> None:
+        """Add a quad with one colour per corner (for gradients)."""
+
+        for a, b, c in ((0, 1, 2), (0, 2, 3)):
+            self._tri_positions.extend(
+                (
+                    corners[a][0], corners[a][1],
+                    corners[b][0], corners[b][1],
+                    corners[c][0], corners[c][1],
+                )
+            )
+            self._tri_colors.extend(rgbas[a] + rgbas[b] + rgbas[c])
+        self._mark(gl.GL_TRIANGLES, len(self._tri_positions))
+
+    def add_polygon(
+        self, points: Sequence[Vec2], rgba: Tuple[int, int, int, int]
+    ) -> None:
+        """Triangulate a convex polygon (fan order) into the batch."""
+
+        for index in range(1, len(points) - 1):
+            self.add_triangle(points[0], points[index], points[index + 1], rgba)
+
+    def add_disk(
+        self,
+        center: Vec2,
+        radii: Vec2,
+        step_degrees: int,
+        rgba: Tuple[int, int, int, int],
+    ) -> None:
+        """Add a filled ellipse from the cached unit-disk template."""
+
+        points = _unit_disk(step_degrees) * np.asarray(radii, dtype=np.float32)
+        points += np.asarray(center, dtype=np.float32)
+        self._tri_positions.frombytes(points.tobytes())
+        self._tri_colors.frombytes(bytes(rgba) * (len(points)))
+        self._mark(gl.GL_TRIANGLES, len(self._tri_positions))
+
+    def add_line(
+        self, start: Vec2, end: Vec2, rgba: Tuple[int, int, int, int]
+    ) -> None:
+        self._line_positions.extend((start[0], start[1], end[0], end[1]))
+        self._line_colors.extend(rgba * 2)
+        self._mark(gl.GL_LINES, len(self._line_positions))
+
+    def add_line_loop(
+        self, points: Sequence[Vec2], rgba: Tuple[int, int, int, int]
+    ) -> None:
+        for index in range(len(points)):
+            self.add_line(points[index], points[(index + 1) % len(points)], rgba)
+
+    def flush(self) -> None:
+        tri_positions = self._tri_positions
+        tri_colors = self._tri_colors
+        line_positions = self._line_positions
+        line_colors = self._line_colors
+        tri_start = 0
+        line_start = 0
+        for mode, end in self._runs:
+            if mode == gl.GL_TRIANGLES:
+                if tri_start == 0 and end == len(tri_positions):
+                    _draw_vertex_array(mode, tri_positions, tri_colors)
+                else:
+                    _draw_vertex_array(
+                        mode,
+                        tri_positions[tri_start:end],
+                        tri_colors[tri_start * 2 : end * 2],
+                    )
+                tri_start = end
+            else:
+                if line_start == 0 and end == len(line_positions):
+                    _draw_vertex_array(mode, line_positions, line_colors)
+                else:
+                    _draw_vertex_array(
+                        mode,
+                        line_positions[line_start:end],
+                        line_colors[line_start * 2 : end * 2],
+                    )
+                line_start = end
+        del self._runs[:]
+        del tri_positions[:]
+        del tri_colors[:]
+        del line_positions[:]
+        del line_colors[:]
+
+
+@dataclass(slots=True, frozen=True)
+class StarField:
+    """Backdrop stars stored as parallel arrays for vectorized twinkle."""
+
+    xs: np.ndarray
+    ys: np.ndarray
+    base_brightness: np.ndarray
+    twinkle_speed: np.ndarray
+    phase: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
+@dataclass(slots=True, frozen=True)
+class SphereTables:
+    """Static per-vertex geometry for a latitude/longitude sphere grid.
+
+    The grid angles never change between frames, so the trig evaluations and
+    the ``cos_lat * cos_lon`` style normal products collapse into float32
+    lookups consumed by the vectorized surface kernels and the indexed draw.
+    """
+
+    lons: np.ndarray  # (lon_segments + 1,) longitude angles
+    sin_lats: np.ndarray  # (lat_segments + 1,)
+    nx: np.ndarray  # (lat_segments + 1, lon_segments + 1) unit normals
+    ny: np.ndarray
+    nz: np.ndarray
+    tri_indices_front: np.ndarray  # visible-hemisphere triangle gather
+
+
+@lru_cache(maxsize=8)
+def _sphere_tables_for(lat_segments: int, lon_segments: int) -> SphereTables:
+    """Build (and memoize) the sphere grid tables for a tessellation level."""
+
+    lats = np.linspace(
+        -0.5 * math.pi, 0.5 * math.pi, lat_segments + 1, dtype=np.float32
+    )
+    lons = np.linspace(0.0, math.tau, lon_segments + 1, dtype=np.float32)
+    sin_lats = np.sin(lats)
+    cos_lats = np.cos(lats)
+    sin_lons = np.sin(lons)
+    cos_lons = np.cos(lons)
+    nx = cos_lats[:, None] * cos_lons[None, :]
+    ny = np.broadcast_to(sin_lats[:, None], nx.shape).copy()
+    nz = cos_lats[:, None] * sin_lons[None, :]
+    # Two triangles per grid quad, indexing the flattened (lat+1, lon+1)
+    # vertex grid. Precomputing the gather once lets each planet go out in a
+    # single glDrawArrays submission instead of one strip per latitude band.
+    grid = np.arange((lat_segments + 1) * (lon_segments + 1), dtype=np.int32)
+    grid = grid.reshape(lat_segments + 1, lon_segments + 1)
+    top_left = grid[:-1, :-1]
+    bottom_left = grid[1:, :-1]
+    top_right = grid[:-1, 1:]
+    bottom_right = grid[1:, 1:]
+    tri_quads = np.stack(
+        (top_left, bottom_left, top_right, bottom_left, bottom_right, top_right),
+        axis=-1,
+    )
+    # The 2D projection folds both hemispheres onto the same disk; quads are
+    # rasterized in longitude order, so only the second half of each row
+    # survives the overdraw. Culling the hidden half up front halves the
+    # gather and submission work without changing the image.
+    tri_indices_front = tri_quads[:, lon_segments // 2 :, :].reshape(-1)
+    tables = SphereTables(
+        lons=lons,
+        sin_lats=sin_lats,
+        nx=nx,
+        ny=ny,
+        nz=nz,
+        tri_indices_front=tri_indices_front,
+    )
+    for column in (tables.lons, tables.sin_lats, tables.nx, tables.ny,
+                   tables.nz, tables.tri_indices_front):
+        column.setflags(write=False)
+    return tables
+
+
+@lru_cache(maxsize=4)
+def _starfield_for(
+    count: int,
+    brightness_range: Tuple[float, float],
+    speed_range: Tuple[float, float],
+    seed: Optional[int] = None,
+) -> StarField:
+    """Generate (and memoize) a starfield for the given parameters.
+
+    Both cutscenes use fixed star counts, so replaying a cutscene or
+    constructing both classes reuses the already-generated field instead of
+    rerunning the RNG loops.
+    """
+
+    rng = np.random.default_rng(seed)
+    positions = rng.random((count, 2), dtype=np.float32)
+    field = StarField(
+        xs=np.ascontiguousarray(positions[:, 0]),
+        ys=np.ascontiguousarray(positions[:, 1]),
+        base_brightness=rng.uniform(*brightness_range, count).astype(np.float32),
+        twinkle_speed=rng.uniform(*speed_range, count).astype(np.float32),
+        phase=rng.uniform(0.0, math.tau, count).astype(np.float32),
+    )
+    for column in (field.xs, field.ys, field.base_brightness, field.twinkle_speed, field.phase):
+        column.setflags(write=False)
+    return field
 
 
 class CampaignOpeningCutscene:
@@ -49,6 +371,21 @@ class CampaignOpeningCutscene:
         (math.radians(150.0), -0.35, 1.0, 0.8),
     )
 
+    EARTH_LAT_SEGMENTS = 72
+    EARTH_LON_SEGMENTS = 144
+    MARS_LAT_SEGMENTS = 64
+    MARS_LON_SEGMENTS = 128
+    # Tessellation ladder for Mars, coarse to fine; a level is chosen so
+    # triangle edges stay near MARS_TARGET_EDGE_PX on screen instead of
+    # always paying for the full grid while the sphere is small.
+    MARS_TESSELLATION_LEVELS = ((16, 32), (32, 64), (48, 96), (64, 128))
+    MARS_TARGET_EDGE_PX = 6.0
+    EARTH_RING_SEGMENTS = 240
+    MARS_RING_SEGMENTS = 200
+    # Surface cloud/dust keyframe rate; frames in between lerp the two
+    # bracketing keyframes instead of re-running the trig kernels.
+    CLOUD_REFRESH_HZ = 15.0
+
     # Shared scene-two room dimensions so the couch, TV, and window align
     # precisely on their respective walls.
     SCENE2_ROOM_WIDTH = 11.0
@@ -59,20 +396,110 @@ class CampaignOpeningCutscene:
         pygame.font.init()
         self._viewport_size = viewport_size
         self._elapsed = 0.0
-        self._stars: List[Star] = self._generate_starfield(320)
+        self._fade_done = False
+        self._cloud_phase = 0.0
+        self._cloud_turb_phase = 0.0
+        self._earth_band_lut = self._build_earth_band_lut()
+        self._earth_band_array = np.asarray(self._earth_band_lut)
+        self._earth_tables = _sphere_tables_for(
+            self.EARTH_LAT_SEGMENTS, self.EARTH_LON_SEGMENTS
+        )
+        self._earth_static = self._build_earth_static_terms()
+        # Mars static terms are built lazily per tessellation level.
+        self._mars_static_cache: Dict[Tuple[int, int], Dict[str, np.ndarray]] = {}
+        # Keyframe caches for the memoized surface kernels.
+        self._cloud_step = 1.0 / self.CLOUD_REFRESH_HZ
+        self._earth_cloud_frames: Dict[int, np.ndarray] = {}
+        self._mars_dust_frames: Dict[Tuple[Tuple[int, int], int], np.ndarray] = {}
+        self._stars: StarField = self._generate_starfield(320)
         self._caption_font = pygame.font.SysFont("Consolas", 36)
         self._caption_text = "2150 A.D."
+        self._caption_texture: Optional[int] = None
+        self._caption_size = (0, 0)
+        # Star pixel positions depend only on the viewport, so they are
+        # rebuilt on resize instead of rescaled from normalized coordinates
+        # every frame; the color buffer persists with a fixed alpha column.
+        self._star_px = np.empty((len(self._stars), 2), dtype=np.float32)
+        self._star_rgba = np.empty((len(self._stars), 4), dtype=np.uint8)
+        self._star_rgba[:, 3] = 255
+        self._star_scratch = np.empty(len(self._stars), dtype=np.float32)
+        # Fade overlay quad: only the alpha column varies frame to frame.
+        self._fade_quad_xy = np.empty(8, dtype=np.float32)
+        self._fade_quad_rgba = np.zeros(16, dtype=np.uint8)
+        self._rebuild_star_px()
+        self._rebuild_background_mesh()
+        # Gather buffers for the planet grid draws, keyed by tessellation.
+        self._grid_scratch: Dict[
+            Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]
+        ] = {}
+        self._build_ring_templates()
+
+    def _build_ring_templates(self) -> None:
+        """Precompute the unit-circle templates for the atmosphere overlays.
+
+        The wisp fan and both glow strips are topologically static: only the
+        center/radius (and a couple of alpha channels) change per frame, so
+        the trig, the static sin/exp arguments, and every constant color
+        byte are baked here into persistent draw buffers.
+        """
+
+        ring = self.EARTH_RING_SEGMENTS
+        angles = np.linspace(0.0, math.tau, ring + 1)
+        cos_ring = np.cos(angles)
+        sin_ring = np.sin(angles)
+        self._earth_ring_cs = (cos_ring, sin_ring)
+
+        # Wisp fan: cloud cover sampled just outside the limb. The cover
+        # formula's static pieces (equatorial falloff and the phase-free sin
+        # arguments) are tabled; per frame only two sins and the alpha
+        # column remain.
+        wisp_angle = angles * 1.07 + 0.4
+        wisp_lat = sin_ring * 0.9
+        self._wisp_equatorial = np.exp(-np.abs(wisp_lat) * 3.5)
+        self._wisp_rot_arg = wisp_angle * 3.8 + wisp_lat * 6.0
+        self._wisp_turb_arg = wisp_angle * 6.2
+        self._wisp_mod_arg = angles * 2.0
+        self._wisp_xy = np.empty((ring + 2, 2), dtype=np.float32)
+        self._wisp_rgba = np.empty((ring + 2, 4), dtype=np.uint8)
+        self._wisp_rgba[:, :3] = 255
+        self._wisp_rgba[0, 3] = 0
+
+        # Earth glow strip: colors are fully static, positions scale with
+        # radius. Even rows are the inner edge, odd rows the outer.
+        falloff = 0.2 + 0.15 * (1.0 - np.abs(sin_ring))
+        self._earth_glow_xy = np.empty((2 * (ring + 1), 2), dtype=np.float32)
+        self._earth_glow_rgba = np.empty((2 * (ring + 1), 4), dtype=np.uint8)
+        self._earth_glow_rgba[0::2] = (89, 165, 255, 5)
+        self._earth_glow_rgba[1::2, :3] = (89, 191, 255)
+        self._earth_glow_rgba[1::2, 3] = (falloff * 255.0).astype(np.uint8)
+
+        # Mars glow strip: same layout, but the outer alpha scales with the
+        # per-frame visibility, so only its base factor is static.
+        mars_ring = self.MARS_RING_SEGMENTS
+        mars_angles = np.linspace(0.0, math.tau, mars_ring + 1)
+        self._mars_ring_cs = (np.cos(mars_angles), np.sin(mars_angles))
+        self._mars_glow_base = 0.12 + 0.08 * (1.0 - np.abs(np.sin(mars_angles)))
+        self._mars_glow_xy = np.empty((2 * (mars_ring + 1), 2), dtype=np.float32)
+        self._mars_glow_rgba = np.empty((2 * (mars_ring + 1), 4), dtype=np.uint8)
+        self._mars_glow_rgba[0::2] = (242, 140, 63, 0)
+        self._mars_glow_rgba[1::2, :3] = (255, 178, 89)
 
     # ------------------------------------------------------------------
     # Public API
     def reset(self) -> None:
         self._elapsed = 0.0
+        self._fade_done = False
 
     def update(self, dt: float) -> None:
         self._elapsed = min(self._elapsed + dt, self.TOTAL_DURATION)
 
     def draw(self) -> None:
         width, height = self._viewport_size
+        # Phase products consumed by the wisp overlay are frame constants,
+        # so compute them once here. The surface kernels derive the same
+        # rates from their keyframe times.
+        self._cloud_phase = self._elapsed * 0.65
+        self._cloud_turb_phase = self._elapsed * 0.5
         gl.glDisable(gl.GL_DEPTH_TEST)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
         gl.glViewport(0, 0, width, height)
@@ -83,56 +510,137 @@ class CampaignOpeningCutscene:
         gl.glLoadIdentity()
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+        _enable_vertex_arrays()
 
         self._draw_background()
         self._draw_planets()
         self._draw_caption()
-        self._draw_fade_overlay()
-
+        # Once the fade-in completes the overlay is fully transparent for the
+        # rest of the cutscene, so stop calling into it every frame.
+        if not self._fade_done:
+            if self._elapsed >= self.FADE_IN_DURATION:
+                self._fade_done = True
+            else:
+                self._draw_fade_overlay()
+
+        _disable_vertex_arrays()
         gl.glDisable(gl.GL_BLEND)
         gl.glEnable(gl.GL_DEPTH_TEST)
 
     def update_viewport(self, viewport_size: Tuple[int, int]) -> None:
+        if viewport_size == self._viewport_size:
+            return
         self._viewport_size = viewport_size
+        self._rebuild_star_px()
+        self._rebuild_background_mesh()
 
     def is_finished(self) -> bool:
         return self._elapsed >= self.TOTAL_DURATION
 
     # ------------------------------------------------------------------
     # Rendering helpers
-    def _draw_background(self) -> None:
+    def _rebuild_star_px(self) -> None:
+        width, height = self._viewport_size
+        self._star_px[:, 0] = self._stars.xs * width
+        self._star_px[:, 1] = self._stars.ys * height
+        self._fade_quad_xy[:] = (0.0, 0.0, width, 0.0, width, height, 0.0, height)
+
+    def _draw_planet_grid(
+        self,
+        tables: SphereTables,
+        center: Vec2,
+        radius: float,
+        y_squish: float,
+        grid_colors: Sequence[int],
+    ) -> None:
+        """Submit a whole sphere grid as one indexed GL_TRIANGLES draw.
+
+        ``grid_colors`` holds one RGBA tuple per grid vertex in row-major
+        order; the precomputed triangle indices gather both positions and
+        colors, so the planet goes to the driver in a single call instead of
+        one strip per latitude band.
+        """
+
+        flat_count = tables.nx.size
+        indices = tables.tri_indices_front
+        # Persistent per-tessellation buffers: one for the grid positions and
+        # two for the gathered triangle stream, so the hot path allocates
+        # nothing and the driver reads from stable client arrays.
+        scratch = self._grid_scratch.get(tables.nx.shape)
+        if scratch is None:
+            scratch = (
+                np.empty((flat_count, 2), dtype=np.float32),
+                np.empty((len(indices), 2), dtype=np.float32),
+                np.empty((len(indices), 4), dtype=np.uint8),
+            )
+            self._grid_scratch[tables.nx.shape] = scratch
+        xy, tri_xy, tri_rgba = scratch
+        xy[:, 0] = tables.nx.reshape(-1)
+        xy[:, 0] *= radius
+        xy[:, 0] += center[0]
+        xy[:, 1] = tables.ny.reshape(-1)
+        xy[:, 1] *= radius * y_squish
+        xy[:, 1] += center[1]
+        rgba = np.asarray(grid_colors, dtype=np.uint8).reshape(flat_count, 4)
+        np.take(xy, indices, axis=0, out=tri_xy)
+        np.take(rgba, indices, axis=0, out=tri_rgba)
+        _draw_vertex_array(
+            gl.GL_TRIANGLES, tri_xy.reshape(-1), tri_rgba.reshape(-1)
+        )
+
+    def _rebuild_background_mesh(self) -> None:
+        """Triangulate the gradient and nebula haze for the current viewport.
+
+        The geometry depends only on the viewport size, so it is assembled
+        into persistent arrays here (the client-array analogue of compiling
+        a display list) and resubmitted verbatim every frame.
+        """
+
         width, height = self._viewport_size
-        # Deep space gradient
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.01, 0.01, 0.025, 1.0)
-        gl.glVertex2f(0.0, 0.0)
-        gl.glVertex2f(width, 0.0)
-        gl.glColor4f(0.0, 0.0, 0.0, 1.0)
-        gl.glVertex2f(width, height)
-        gl.glVertex2f(0.0, height)
-        gl.glEnd()
-
-        # Subtle nebula haze
-        gl.glColor4f(0.09, 0.06, 0.18, 0.25)
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glVertex2f(width * 0.75, height * 0.35)
+        batch = _PrimitiveBatch()
+        batch.add_quad_shaded(
+            ((0.0, 0.0), (width, 0.0), (width, height), (0.0, height)),
+            ((2, 2, 6, 255), (2, 2, 6, 255), (0, 0, 0, 255), (0, 0, 0, 255)),
+        )
+
+        haze_points: List[Vec2] = [(width * 0.75, height * 0.35)]
         haze_radius = max(width, height) * 0.8
-        for angle in range(0, 361, 5):
-            rad = math.radians(angle)
-            gl.glVertex2f(
-                width * 0.75 + math.cos(rad) * haze_radius,
-                height * 0.35 + math.sin(rad) * haze_radius * 0.6,
+        for cos_a, sin_a in _unit_circle(5):
+            haze_points.append(
+                (
+                    width * 0.75 + cos_a * haze_radius,
+                    height * 0.35 + sin_a * haze_radius * 0.6,
+                )
             )
-        gl.glEnd()
+        batch.add_polygon(haze_points, (22, 15, 45, 63))
+        self._bg_tri_xy = np.asarray(batch._tri_positions, dtype=np.float32)
+        self._bg_tri_rgba = np.asarray(batch._tri_colors, dtype=np.uint8)
+
+    def _draw_background(self) -> None:
+        # Deep space gradient and nebula haze come from the viewport-keyed
+        # cache as one triangle submission.
+        _draw_vertex_array(gl.GL_TRIANGLES, self._bg_tri_xy, self._bg_tri_rgba)
 
         gl.glPointSize(2.0)
-        gl.glBegin(gl.GL_POINTS)
-        for star in self._stars:
-            twinkle = math.sin(self._elapsed * star.twinkle_speed + star.phase)
-            brightness = max(0.0, min(1.0, star.base_brightness + twinkle * 0.25))
-            gl.glColor4f(brightness, brightness, brightness, 1.0)
-            gl.glVertex2f(star.position[0] * width, star.position[1] * height)
-        gl.glEnd()
+        stars = self._stars
+        # Positions come from the viewport-keyed cache; only the twinkle
+        # channels change frame to frame, computed in-place in the scratch
+        # column so the star pass allocates nothing.
+        scratch = self._star_scratch
+        np.multiply(stars.twinkle_speed, self._elapsed, out=scratch)
+        scratch += stars.phase
+        np.sin(scratch, out=scratch)
+        scratch *= 0.25
+        scratch += stars.base_brightness
+        np.clip(scratch, 0.0, 1.0, out=scratch)
+        scratch *= 255.0
+        star_rgba = self._star_rgba
+        star_rgba[:, 0] = scratch
+        star_rgba[:, 1] = scratch
+        star_rgba[:, 2] = star_rgba[:, 0]
+        _draw_vertex_array(
+            gl.GL_POINTS, self._star_px.reshape(-1), star_rgba.reshape(-1)
+        )
 
     def _draw_planets(self) -> None:
         width, height = self._viewport_size
@@ -145,6 +653,10 @@ class CampaignOpeningCutscene:
         )
         self._draw_earth(earth_center, earth_radius)
 
+        # Mars stays hidden until well into the pan; skip the visibility math
+        # entirely while the camera is still holding on Earth.
+        if pan_progress <= 0.0:
+            return
         mars_visibility = self._mars_visibility(pan_progress)
         if mars_visibility <= 0.0:
             return
@@ -163,277 +675,404 @@ class CampaignOpeningCutscene:
         Draw Earth as a latitude/longitude grid so continents and oceans
         appear as actual shapes, with sharper surface detail.
         """
-        # Higher tessellation for crisper features
-        lat_segments = 72
-        lon_segments = 144
+        tables = self._earth_tables
+        self._draw_planet_grid(
+            tables, center, radius, 0.98, self._earth_grid_colors(tables)
+        )
+
+        # Cloud wisps overlay (kept subtle), driven by the ring templates:
+        # two sins for the drifting cover, then scale and shift the circle.
+        center_x, center_y = center
+        cos_ring, sin_ring = self._earth_ring_cs
+        wisp_phase = self._elapsed * 0.4
+        rotating = 0.5 + 0.5 * np.sin(self._wisp_rot_arg + self._cloud_phase)
+        turbulence = 0.5 + 0.5 * np.sin(self._wisp_turb_arg - self._cloud_turb_phase)
+        cover = np.clip(
+            self._wisp_equatorial * rotating * 0.6 + turbulence * 0.25, 0.0, 1.0
+        )
+        cover *= 0.16 + 0.10 * np.sin(wisp_phase + self._wisp_mod_arg)
+        self._wisp_xy[0] = center
+        self._wisp_xy[1:, 0] = center_x + cos_ring * (radius * 1.005)
+        self._wisp_xy[1:, 1] = center_y + sin_ring * (radius * 0.99)
+        self._wisp_rgba[1:, 3] = (np.clip(cover, 0.0, 1.0) * 255.0).astype(np.uint8)
+        _draw_vertex_array(
+            gl.GL_TRIANGLE_FAN, self._wisp_xy.reshape(-1), self._wisp_rgba.reshape(-1)
+        )
+
+        # Atmospheric glow: colors are fully static, positions rescale.
+        glow_xy = self._earth_glow_xy
+        glow_xy[0::2, 0] = center_x + cos_ring * (radius * 1.02)
+        glow_xy[0::2, 1] = center_y + sin_ring * (radius * 1.02)
+        glow_xy[1::2, 0] = center_x + cos_ring * (radius * 1.06)
+        glow_xy[1::2, 1] = center_y + sin_ring * (radius * 1.06)
+        _draw_vertex_array(
+            gl.GL_TRIANGLE_STRIP, glow_xy.reshape(-1), self._earth_glow_rgba.reshape(-1)
+        )
+
+    def _earth_grid_colors(self, tables: SphereTables) -> np.ndarray:
+        """Shade every Earth grid vertex, memoized at CLOUD_REFRESH_HZ.
+
+        The cloud drift is a smooth function of time, so the trig kernel is
+        only evaluated on 1/15s keyframes; every frame in between blends
+        the two bracketing keyframes, which costs a single lerp over the
+        grid instead of the full sin cascade.
+        """
+
+        tick, frac = self._cloud_keyframe_phase()
+        frames = self._earth_cloud_frames
+        prev = frames.get(tick)
+        if prev is None:
+            prev = self._earth_surface_rgb(tables, tick * self._cloud_step)
+        curr = frames.get(tick + 1)
+        if curr is None:
+            curr = self._earth_surface_rgb(tables, (tick + 1) * self._cloud_step)
+        self._earth_cloud_frames = {tick: prev, tick + 1: curr}
+
+        base = prev + (curr - prev) * np.float32(frac)
+        rgba = np.empty(base.shape[:2] + (4,), dtype=np.uint8)
+        rgba[..., :3] = (base * 255.0).astype(np.uint8)
+        rgba[..., 3] = 255
+        return rgba.reshape(-1, 4)
+
+    def _earth_surface_rgb(self, tables: SphereTables, kernel_time: float) -> np.ndarray:
+        """Evaluate the Earth surface kernel at an exact point in time.
+
+        Mirrors the former scalar pipeline step for step (same clamp order)
+        as whole-grid float32 array operations instead of ~10k Python
+        iterations. The phase rates match the ones update() feeds the wisp
+        overlay so surface clouds and wisps stay in sync.
+        """
+
+        lon = tables.lons[None, :]
+        lat = tables.sin_lats[:, None]
+        static = self._earth_static
+
+        # The surface colors (continents, desert, ice, ocean specular) are
+        # baked into the static base; only the two phase-driven cloud sin
+        # patterns are evaluated and blended on top.
+        rotating_pattern = 0.5 + 0.5 * np.sin(
+            lon * 3.8 + kernel_time * 0.65 + lat * 6.0
+        )
+        turbulence = 0.5 + 0.5 * np.sin(lon * 6.2 - kernel_time * 0.5)
+        cloud_cover = np.clip(
+            static["equatorial_band"] * rotating_pattern * 0.6 + turbulence * 0.25,
+            0.0,
+            1.0,
+        )
+        base = static["base0"] + static["cloud_gain"] * (
+            cloud_cover * 0.55
+        )[..., None]
+
+        np.clip(base, 0.0, 1.0, out=base)
+        base *= static["brightness"][..., None]
+        np.clip(base, 0.0, 1.0, out=base)
+        return base
+
+    def _mars_grid_colors(self, tables: SphereTables, visibility_u8: int) -> np.ndarray:
+        """Shade every Mars grid vertex, memoized at CLOUD_REFRESH_HZ.
+
+        Same keyframe-and-lerp scheme as the Earth grid; the cache key
+        includes the tessellation shape because the adaptive level can
+        change with the viewport.
+        """
+
+        tick, frac = self._cloud_keyframe_phase()
+        shape = tables.nx.shape
+        frames = self._mars_dust_frames
+        prev = frames.get((shape, tick))
+        if prev is None:
+            prev = self._mars_surface_rgb(tables, tick * self._cloud_step)
+        curr = frames.get((shape, tick + 1))
+        if curr is None:
+            curr = self._mars_surface_rgb(tables, (tick + 1) * self._cloud_step)
+        self._mars_dust_frames = {(shape, tick): prev, (shape, tick + 1): curr}
+
+        base = prev + (curr - prev) * np.float32(frac)
+        rgba = np.empty(base.shape[:2] + (4,), dtype=np.uint8)
+        rgba[..., :3] = (base * 255.0).astype(np.uint8)
+        rgba[..., 3] = visibility_u8
+        return rgba.reshape(-1, 4)
+
+    def _mars_surface_rgb(self, tables: SphereTables, kernel_time: float) -> np.ndarray:
+        """Evaluate the Mars surface kernel at an exact point in time.
+
+        Same structure as the old scalar _mars_albedo cascade — basins,
+        highlands, canyon band, dust storms, polar caps — reproduced in
+        vectorized float32 form.
+        """
+
+        lon = tables.lons[None, :]
+        lat = tables.sin_lats[:, None]
+        static = self._mars_static_for(tables)
+
+        # The basin/highland/canyon/ice colors are baked into the static
+        # base; only the drifting dust-storm pattern is evaluated and added
+        # through its ice-attenuated gain.
+        dust = (0.5 + 0.5 * np.sin(lon * 4.5 + kernel_time * 0.7 + lat * 3.7)) * 0.30
+        base = static["base_ice"] + dust[..., None] * static["dust_gain"]
+
+        np.clip(base, 0.0, 1.0, out=base)
+        base *= static["brightness"][..., None]
+        np.clip(base, 0.0, 1.0, out=base)
+        return base
+
+    def _cloud_keyframe_phase(self) -> Tuple[int, float]:
+        """Split elapsed time into a keyframe index and blend fraction."""
+
+        scaled = self._elapsed * self.CLOUD_REFRESH_HZ
+        tick = int(scaled)
+        return tick, scaled - tick
+
+    def _build_earth_static_terms(self) -> Dict[str, np.ndarray]:
+        """Evaluate Earth's time-invariant shading grids once.
+
+        Lighting, the continent blob mask, coastline noise, latitude bands
+        (dryness, ice), the cloud equatorial falloff, and the ocean specular
+        term all depend only on the fixed grid angles and light direction,
+        so the transcendentals behind them run here instead of every frame.
+        """
+
+        tables = self._earth_tables
+        lon = tables.lons.astype(np.float64)[None, :]
+        lat = tables.sin_lats.astype(np.float64)[:, None]
+        abs_lat = np.abs(lat)
 
-        # 3D light direction for nicer shading
         light_dir = self._normalized3((-0.4, -0.2, 0.4))
+        shade = (
+            tables.nx.astype(np.float64) * light_dir[0]
+            + tables.ny.astype(np.float64) * light_dir[1]
+            + tables.nz.astype(np.float64) * light_dir[2]
+        )
+        np.maximum(shade, 0.0, out=shade)
 
-        # Palette with stronger contrast
-        deep_ocean = (0.02, 0.05, 0.18)
-        shallow_ocean = (0.05, 0.18, 0.33)
-        lowland = (0.09, 0.42, 0.18)
-        highland = (0.32, 0.35, 0.20)
-        mountain = (0.70, 0.70, 0.72)
-        ice_color = (0.96, 0.98, 1.0)
-
-        for lat_i in range(lat_segments):
-            lat0 = -0.5 * math.pi + (lat_i / lat_segments) * math.pi
-            lat1 = -0.5 * math.pi + ((lat_i + 1) / lat_segments) * math.pi
-
-            gl.glBegin(gl.GL_TRIANGLE_STRIP)
-            for lon_i in range(lon_segments + 1):
-                lon = (lon_i / lon_segments) * math.tau
-
-                for lat_angle in (lat0, lat1):
-                    sin_lat = math.sin(lat_angle)
-                    cos_lat = math.cos(lat_angle)
-                    cos_lon = math.cos(lon)
-                    sin_lon = math.sin(lon)
-
-                    # 3D normal on sphere
-                    nx = cos_lat * cos_lon
-                    ny = sin_lat
-                    nz = cos_lat * sin_lon
-                    normal3 = (nx, ny, nz)
-
-                    # 2D projection (slight vertical squish)
-                    vx = center[0] + nx * radius
-                    vy = center[1] + ny * radius * 0.98
-
-                    # Parameters for surface functions
-                    angle = lon
-                    lat = sin_lat
-                    abs_lat = abs(lat)
-
-                    # Lighting
-                    shade = max(0.0, self._dot3(normal3, light_dir))
-
-                    # Base continent "height"
-                    height_raw = self._earth_continent_mask(angle, lat)
-                    # Sharpen land/ocean separation and add subtle edge noise
-                    # so coastlines are more defined.
-                    height = height_raw
-                    height = (height - 0.15) / 0.85  # push small values towards ocean
-                    height = max(0.0, min(1.0, height))
-                    # Edge noise – small, so we don't flicker
-                    edge_noise = 0.05 * math.sin(angle * 8.3 + lat * 17.1)
-                    height = max(0.0, min(1.0, height + edge_noise))
-
-                    # Classify terrain bands more aggressively for crisp biomes
-                    if height < 0.08:
-                        # deep ocean
-                        base_r, base_g, base_b = deep_ocean
-                    elif height < 0.25:
-                        # shallow ocean / coastal shelf
-                        t = (height - 0.08) / (0.25 - 0.08)
-                        base_r = self._lerp(deep_ocean[0], shallow_ocean[0], t)
-                        base_g = self._lerp(deep_ocean[1], shallow_ocean[1], t)
-                        base_b = self._lerp(deep_ocean[2], shallow_ocean[2], t)
-                    elif height < 0.45:
-                        # lush lowlands
-                        t = (height - 0.25) / (0.45 - 0.25)
-                        base_r = self._lerp(shallow_ocean[0], lowland[0], t)
-                        base_g = self._lerp(shallow_ocean[1], lowland[1], t)
-                        base_b = self._lerp(shallow_ocean[2], lowland[2], t)
-                    elif height < 0.7:
-                        # highlands
-                        t = (height - 0.45) / (0.7 - 0.45)
-                        base_r = self._lerp(lowland[0], highland[0], t)
-                        base_g = self._lerp(lowland[1], highland[1], t)
-                        base_b = self._lerp(lowland[2], highland[2], t)
-                    else:
-                        # mountains
-                        t = min(1.0, (height - 0.7) / 0.3)
-                        base_r = self._lerp(highland[0], mountain[0], t)
-                        base_g = self._lerp(highland[1], mountain[1], t)
-                        base_b = self._lerp(highland[2], mountain[2], t)
-
-                    # A bit of drier tint near equator on land only
-                    if height >= 0.25:
-                        dryness = max(0.0, 1.0 - abs_lat * 3.0)
-                        desert_tint = (0.60, 0.50, 0.30)
-                        desert_strength = 0.35 * dryness * (height - 0.25)
-                        base_r = self._lerp(base_r, desert_tint[0], desert_strength)
-                        base_g = self._lerp(base_g, desert_tint[1], desert_strength)
-                        base_b = self._lerp(base_b, desert_tint[2], desert_strength)
-
-                    # Polar ice caps – narrower and sharper
-                    ice = self._smoothstep(0.78, 0.9, abs_lat)
-                    base_r = self._lerp(base_r, ice_color[0], ice)
-                    base_g = self._lerp(base_g, ice_color[1], ice)
-                    base_b = self._lerp(base_b, ice_color[2], ice)
-
-                    # Clouds – keep them, but less washing
-                    cloud_cover = self._earth_cloud_cover(angle, lat)
-                    if cloud_cover > 0.0:
-                        cloud_intensity = cloud_cover * 0.55
-                        base_r = self._lerp(base_r, 1.0, cloud_intensity * 0.5)
-                        base_g = self._lerp(base_g, 1.0, cloud_intensity * 0.6)
-                        base_b = self._lerp(base_b, 1.0, cloud_intensity * 0.7)
-
-                    # Specular highlight on oceans – small, sharp glint
-                    if height < 0.25:
-                        spec = max(0.0, shade - 0.85) * 5.0
-                        base_r += spec * 0.28
-                        base_g += spec * 0.32
-                        base_b += spec * 0.40
-
-                    base_r = self._clamp01(base_r)
-                    base_g = self._clamp01(base_g)
-                    base_b = self._clamp01(base_b)
-
-                    brightness = 0.32 + 0.68 * shade
-                    r = base_r * brightness
-                    g = base_g * brightness
-                    b = base_b * brightness
-
-                    gl.glColor4f(
-                        self._clamp01(r),
-                        self._clamp01(g),
-                        self._clamp01(b),
-                        1.0,
-                    )
-                    gl.glVertex2f(vx, vy)
-            gl.glEnd()
-
-        # Cloud wisps overlay (kept subtle)
-        ring_segments = 240
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glColor4f(1.0, 1.0, 1.0, 0.0)
-        gl.glVertex2f(*center)
-        for index in range(ring_segments + 1):
-            angle = (index / ring_segments) * math.tau
-            normal = (math.cos(angle), math.sin(angle))
-            cover = self._earth_cloud_cover(angle * 1.07 + 0.4, normal[1] * 0.9)
-            cover *= 0.16 + 0.10 * math.sin(self._elapsed * 0.4 + angle * 2.0)
-            gl.glColor4f(1.0, 1.0, 1.0, cover)
-            gl.glVertex2f(
-                center[0] + normal[0] * radius * 1.005,
-                center[1] + normal[1] * radius * 0.99,
-            )
-        gl.glEnd()
-
-        # Atmospheric glow
-        gl.glBegin(gl.GL_TRIANGLE_STRIP)
-        for index in range(ring_segments + 1):
-            angle = (index / ring_segments) * math.tau
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            outer = 1.06
-            inner = 1.02
-            falloff = 0.2 + 0.15 * (1.0 - abs(sin_a))
-            gl.glColor4f(0.35, 0.65, 1.0, 0.02)
-            gl.glVertex2f(
-                center[0] + cos_a * radius * inner,
-                center[1] + sin_a * radius * inner,
-            )
-            gl.glColor4f(0.35, 0.75, 1.0, falloff)
-            gl.glVertex2f(
-                center[0] + cos_a * radius * outer,
-                center[1] + sin_a * radius * outer,
+        # Continent "height" blob cascade, sharpened towards the ocean.
+        mask = np.zeros(shade.shape)
+        for center_angle, center_lat, angular_width, strength in self.EARTH_CONTINENT_BLOBS:
+            ang_dist = self._wrapped_angle_distance(lon, center_angle)
+            ang_falloff = np.maximum(0.0, 1.0 - (ang_dist / angular_width) ** 2)
+            lat_falloff = np.maximum(
+                0.0, 1.0 - (np.abs(lat - center_lat) / 0.55) ** 2
             )
-        gl.glEnd()
+            mask += ang_falloff * lat_falloff * strength
+        np.clip(mask, 0.0, 1.0, out=mask)
 
-    # ------------------------------------------------------------------
-    # Mars rendering (lat/long strips, sharper features)
-    def _draw_mars(self, center: Vec2, radius: float, visibility: float) -> None:
-        lat_segments = 64
-        lon_segments = 128
+        # Coastline edge noise, then the full static color cascade: band LUT
+        # gather, equatorial desert tint, and polar ice. Clouds are the only
+        # time-varying blend, so everything up to them is baked here — the
+        # software analogue of rendering the surface to a texture once.
+        height = np.clip((mask - 0.15) / 0.85, 0.0, 1.0)
+        height += 0.05 * np.sin(lon * 8.3 + lat * 17.1)
+        np.clip(height, 0.0, 1.0, out=height)
+
+        base = self._earth_band_array[(height * 255.0).astype(np.intp)]
+
+        land = height >= 0.25
+        desert_strength = 0.35 * np.maximum(0.0, 1.0 - abs_lat * 3.0) * (
+            height - 0.25
+        )
+        desert_strength[~land] = 0.0
+        base += (np.array((0.60, 0.50, 0.30)) - base) * desert_strength[..., None]
+
+        ice_t = np.clip((abs_lat - 0.78) / (0.9 - 0.78), 0.0, 1.0)
+        ice = ice_t * ice_t * (3.0 - 2.0 * ice_t)
+        base += (np.array((0.96, 0.98, 1.0)) - base) * ice[..., None]
+
+        # Ocean specular is additive after the cloud lerp, so it folds into
+        # the static base while the cloud gain keeps the pre-spec colors.
+        spec = np.maximum(0.0, shade - 0.85) * 5.0
+        spec[land] = 0.0
+
+        # The builders run once in float64, but the per-frame kernel reads
+        # these grids every frame — store them as float32 to halve that
+        # bandwidth.
+        return {
+            "brightness": (0.32 + 0.68 * shade).astype(np.float32),
+            "equatorial_band": np.exp(-abs_lat * 3.5).astype(np.float32),
+            "base0": (
+                base + spec[..., None] * np.array((0.28, 0.32, 0.40))
+            ).astype(np.float32),
+            "cloud_gain": ((1.0 - base) * np.array((0.5, 0.6, 0.7))).astype(
+                np.float32
+            ),
+        }
+
+    def _build_mars_static_terms(self, tables: SphereTables) -> Dict[str, np.ndarray]:
+        """Evaluate Mars' time-invariant shading grids once.
+
+        Everything except the drifting dust-storm pattern — lighting, the
+        basin/highland masks, the canyon band, and the polar caps — is fixed
+        per tessellation, so it is tabled here.
+        """
+
+        lon = tables.lons.astype(np.float64)[None, :]
+        lat = tables.sin_lats.astype(np.float64)[:, None]
+        abs_lat = np.abs(lat)
 
         light_dir = self._normalized3((-0.35, -0.05, 0.3))
+        shade = (
+            tables.nx.astype(np.float64) * light_dir[0]
+            + tables.ny.astype(np.float64) * light_dir[1]
+            + tables.nz.astype(np.float64) * light_dir[2]
+        )
+        np.maximum(shade, 0.0, out=shade)
 
-        for lat_i in range(lat_segments):
-            lat0 = -0.5 * math.pi + (lat_i / lat_segments) * math.pi
-            lat1 = -0.5 * math.pi + ((lat_i + 1) / lat_segments) * math.pi
+        # Large-scale basins
+        basin_strength = np.zeros(shade.shape)
+        for center_angle, center_lat, angular_width, strength in self.MARS_ALBEDO_FEATURES:
+            ang_dist = self._wrapped_angle_distance(lon, center_angle)
+            ang_falloff = np.maximum(0.0, 1.0 - (ang_dist / angular_width) ** 2)
+            lat_falloff = np.maximum(
+                0.0, 1.0 - (np.abs(lat - center_lat) / 0.75) ** 2
+            )
+            basin_strength += ang_falloff * lat_falloff * strength
+        np.clip(basin_strength, 0.0, 1.0, out=basin_strength)
 
-            gl.glBegin(gl.GL_TRIANGLE_STRIP)
-            for lon_i in range(lon_segments + 1):
-                lon = (lon_i / lon_segments) * math.tau
+        # Local detail, then highland factor sharpened vs basins
+        noise = np.sin(lon * 9.0 + lat * 15.0) * 0.25
+        highland_factor = np.clip(
+            (1.0 - basin_strength) * 1.2 + noise * 0.4, 0.0, 1.0
+        )
 
-                for lat_angle in (lat0, lat1):
-                    sin_lat = math.sin(lat_angle)
-                    cos_lat = math.cos(lat_angle)
-                    cos_lon = math.cos(lon)
-                    sin_lon = math.sin(lon)
+        # Static color cascade: mid tone blended towards basins and
+        # highlands, then darkened by the canyon band.
+        base = np.broadcast_to(
+            np.array((0.55, 0.28, 0.15)), shade.shape + (3,)
+        ).copy()
+        base += (np.array((0.35, 0.17, 0.10)) - base) * (
+            basin_strength * 0.9
+        )[..., None]
+        base += (np.array((0.80, 0.43, 0.24)) - base) * (
+            highland_factor * 0.9
+        )[..., None]
+        canyon = np.maximum(0.0, 1.0 - np.abs(lat + 0.05) * 7.0) * np.maximum(
+            0.0, np.sin(lon * 3.1 - 0.4)
+        )
+        base -= canyon[..., None] * np.array((0.22, 0.14, 0.10))
+
+        # The polar-cap lerp distributes over the additive dust term, so the
+        # iced base and the ice-attenuated dust gain are both precomputable.
+        ice_t = np.clip((abs_lat - 0.8) / (0.93 - 0.8), 0.0, 1.0)
+        ice = (ice_t * ice_t * (3.0 - 2.0 * ice_t))[..., None]
+        base_ice = base * (1.0 - ice) + np.array((0.96, 0.97, 1.0)) * ice
+
+        # Stored as float32 for the same bandwidth reason as the Earth
+        # static terms.
+        return {
+            "brightness": (0.26 + 0.74 * shade).astype(np.float32),
+            "base_ice": base_ice.astype(np.float32),
+            "dust_gain": (np.array((0.16, 0.10, 0.06)) * (1.0 - ice)).astype(
+                np.float32
+            ),
+        }
 
-                    nx = cos_lat * cos_lon
-                    ny = sin_lat
-                    nz = cos_lat * sin_lon
-                    normal3 = (nx, ny, nz)
+    def _mars_static_for(self, tables: SphereTables) -> Dict[str, np.ndarray]:
+        static = self._mars_static_cache.get(tables.nx.shape)
+        if static is None:
+            static = self._build_mars_static_terms(tables)
+            self._mars_static_cache[tables.nx.shape] = static
+        return static
 
-                    vx = center[0] + nx * radius
-                    vy = center[1] + ny * radius * 0.96
+    def _mars_tessellation(self, radius: float) -> Tuple[int, int]:
+        """Pick the coarsest tessellation that keeps edges near target size.
 
-                    angle = lon
-                    lat = sin_lat
+        The on-screen radius is set by the viewport, so small windows never
+        pay for the full 64x128 grid on a sphere spanning a few dozen
+        pixels.
+        """
 
-                    shade = max(0.0, self._dot3(normal3, light_dir))
-                    r, g, b = self._mars_albedo(angle, lat)
+        needed = math.tau * radius / self.MARS_TARGET_EDGE_PX
+        for level in self.MARS_TESSELLATION_LEVELS:
+            if level[1] >= needed:
+                return level
+        return self.MARS_TESSELLATION_LEVELS[-1]
 
-                    brightness = 0.26 + 0.74 * shade
-                    r *= brightness
-                    g *= brightness
-                    b *= brightness
+    # ------------------------------------------------------------------
+    # Mars rendering (lat/long strips, sharper features)
+    def _draw_mars(self, center: Vec2, radius: float, visibility: float) -> None:
+        tables = _sphere_tables_for(*self._mars_tessellation(radius))
+        visibility_u8 = int(self._clamp01(visibility) * 255)
+        self._draw_planet_grid(
+            tables, center, radius, 0.96, self._mars_grid_colors(tables, visibility_u8)
+        )
 
-                    gl.glColor4f(
-                        self._clamp01(r),
-                        self._clamp01(g),
-                        self._clamp01(b),
-                        visibility,
-                    )
-                    gl.glVertex2f(vx, vy)
-            gl.glEnd()
-
-        # Thin Martian atmosphere
-        ring_segments = 200
-        gl.glBegin(gl.GL_TRIANGLE_STRIP)
-        for index in range(ring_segments + 1):
-            angle = (index / ring_segments) * math.tau
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            glow = 0.12 + 0.08 * (1.0 - abs(sin_a))
-            gl.glColor4f(0.95, 0.55, 0.25, 0.0)
-            gl.glVertex2f(
-                center[0] + cos_a * radius * 1.01,
-                center[1] + sin_a * radius * 1.0,
-            )
-            gl.glColor4f(1.0, 0.7, 0.35, glow * visibility)
-            gl.glVertex2f(
-                center[0] + cos_a * radius * 1.08,
-                center[1] + sin_a * radius * 1.05,
-            )
-        gl.glEnd()
+        # Thin Martian atmosphere, driven by the ring templates; only the
+        # outer alpha depends on the per-frame visibility.
+        center_x, center_y = center
+        cos_ring, sin_ring = self._mars_ring_cs
+        glow_xy = self._mars_glow_xy
+        glow_xy[0::2, 0] = center_x + cos_ring * (radius * 1.01)
+        glow_xy[0::2, 1] = center_y + sin_ring * radius
+        glow_xy[1::2, 0] = center_x + cos_ring * (radius * 1.08)
+        glow_xy[1::2, 1] = center_y + sin_ring * (radius * 1.05)
+        self._mars_glow_rgba[1::2, 3] = (
+            self._mars_glow_base * (visibility * 255.0)
+        ).astype(np.uint8)
+        _draw_vertex_array(
+            gl.GL_TRIANGLE_STRIP, glow_xy.reshape(-1), self._mars_glow_rgba.reshape(-1)
+        )
 
     def _draw_caption(self) -> None:
         width, height = self._viewport_size
-        surface = self._caption_font.render(self._caption_text, True, (235, 235, 240))
-        data = pygame.image.tostring(surface, "RGBA", True)
-        text_width = surface.get_width()
+        if self._caption_texture is None:
+            # The caption text never changes, so rasterize it once and keep
+            # it on the GPU; glDrawPixels re-uploaded the pixels every frame
+            # and stalls on most drivers. Created lazily because a GL context
+            # only exists at draw time.
+            surface = self._caption_font.render(
+                self._caption_text, True, (235, 235, 240)
+            )
+            data = pygame.image.tostring(surface, "RGBA", True)
+            self._caption_size = surface.get_size()
+            texture = gl.glGenTextures(1)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+            gl.glTexParameteri(
+                gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST
+            )
+            gl.glTexParameteri(
+                gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST
+            )
+            gl.glTexImage2D(
+                gl.GL_TEXTURE_2D,
+                0,
+                gl.GL_RGBA,
+                self._caption_size[0],
+                self._caption_size[1],
+                0,
+                gl.GL_RGBA,
+                gl.GL_UNSIGNED_BYTE,
+                data,
+            )
+            self._caption_texture = texture
+
+        text_width, text_height = self._caption_size
         x = (width - text_width) * 0.5
-        y = height - surface.get_height() - 32
-        gl.glRasterPos2f(x, y)
-        gl.glDrawPixels(
-            surface.get_width(),
-            surface.get_height(),
-            gl.GL_RGBA,
-            gl.GL_UNSIGNED_BYTE,
-            data,
+        y = height - text_height - 32
+        # The surface was flipped on upload, so v=1 is the top text row.
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._caption_texture)
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glTexCoordPointer(
+            2,
+            gl.GL_FLOAT,
+            0,
+            np.asarray(
+                (0.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0), dtype=np.float32
+            ),
+        )
+        _draw_vertex_array(
+            gl.GL_QUADS,
+            (x, y, x + text_width, y, x + text_width, y + text_height, x, y + text_height),
+            (255, 255, 255, 255) * 4,
         )
+        gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisable(gl.GL_TEXTURE_2D)
 
     def _draw_fade_overlay(self) -> None:
         fade = self._fade_factor()
         if fade >= 1.0:
             return
-        width, height = self._viewport_size
-        gl.glColor4f(0.0, 0.0, 0.0, 1.0 - fade)
-        gl.glBegin(gl.GL_QUADS)
-        gl.glVertex2f(0.0, 0.0)
-        gl.glVertex2f(width, 0.0)
-        gl.glVertex2f(width, height)
-        gl.glVertex2f(0.0, height)
-        gl.glEnd()
+        self._fade_quad_rgba[3::4] = int(self._clamp01(1.0 - fade) * 255)
+        _draw_vertex_array(gl.GL_QUADS, self._fade_quad_xy, self._fade_quad_rgba)
 
     # ------------------------------------------------------------------
     # Timing helpers
@@ -460,16 +1099,60 @@ class CampaignOpeningCutscene:
 
     # ------------------------------------------------------------------
     # Utility helpers
-    def _generate_starfield(self, count: int) -> List[Star]:
-        rng = random.Random(4150)
-        stars: List[Star] = []
-        for _ in range(count):
-            position = (rng.random(), rng.random())
-            base = rng.uniform(0.2, 0.95)
-            speed = rng.uniform(0.6, 2.8)
-            phase = rng.uniform(0.0, math.tau)
-            stars.append(Star(position, base, speed, phase))
-        return stars
+    def _generate_starfield(self, count: int) -> StarField:
+        # The fixed seed keeps the backdrop deterministic; the memoized
+        # module helper means a replay reuses the already-built field.
+        return _starfield_for(count, (0.2, 0.95), (0.6, 2.8), seed=4150)
+
+    @classmethod
+    def _build_earth_band_lut(cls) -> Tuple[Tuple[float, float, float], ...]:
+        """Sample the terrain band classification into a 256-entry color LUT.
+
+        Earth's height->color cascade is piecewise over fixed thresholds, so
+        evaluating it for every vertex each frame is wasted work. Sampling it
+        once at ``h = i / 255`` replaces the per-vertex branch ladder with a
+        single table lookup.
+        """
+
+        # Palette with stronger contrast
+        deep_ocean = (0.02, 0.05, 0.18)
+        shallow_ocean = (0.05, 0.18, 0.33)
+        lowland = (0.09, 0.42, 0.18)
+        highland = (0.32, 0.35, 0.20)
+        mountain = (0.70, 0.70, 0.72)
+
+        lut: List[Tuple[float, float, float]] = []
+        for index in range(256):
+            height = index / 255.0
+            if height < 0.08:
+                # deep ocean
+                color = deep_ocean
+            elif height < 0.25:
+                # shallow ocean / coastal shelf
+                t = (height - 0.08) / (0.25 - 0.08)
+                color = tuple(
+                    cls._lerp(deep_ocean[i], shallow_ocean[i], t) for i in range(3)
+                )
+            elif height < 0.45:
+                # lush lowlands
+                t = (height - 0.25) / (0.45 - 0.25)
+                color = tuple(
+                    cls._lerp(shallow_ocean[i], lowland[i], t) for i in range(3)
+                )
+            elif height < 0.7:
+                # highlands
+                t = (height - 0.45) / (0.7 - 0.45)
+                color = tuple(
+                    cls._lerp(lowland[i], highland[i], t) for i in range(3)
+                )
+            else:
+                # mountains
+                t = min(1.0, (height - 0.7) / 0.3)
+                color = tuple(
+                    cls._lerp(highland[i], mountain[i], t) for i in range(3)
+                )
+            lut.append(color)
+        return tuple(lut)
 
     @staticmethod
     def _dot(a: Vec2, b: Vec2) -> float:
@@ -518,115 +1201,64 @@ class CampaignOpeningCutscene:
 
     # ------------------------------------------------------------------
     # Planet surface helpers
-    def _earth_continent_mask(self, angle: float, lat: float) -> float:
-        """
-        Large-scale "height" map for continents; still smooth, but we
-        sharpen it when mapping to colors.
-        """
-        mask = 0.0
-        for center_angle, center_lat, angular_width, strength in self.EARTH_CONTINENT_BLOBS:
-            ang_dist = self._wrapped_angle_distance(angle, center_angle)
-            lat_dist = abs(lat - center_lat)
-            ang_falloff = max(0.0, 1.0 - (ang_dist / angular_width) ** 2)
-            lat_falloff = max(0.0, 1.0 - (lat_dist / 0.55) ** 2)
-            mask += ang_falloff * lat_falloff * strength
-        return max(0.0, min(1.0, mask))
-
-    def _earth_cloud_cover(self, angle: float, lat: float) -> float:
-        equatorial_band = math.exp(-abs(lat) * 3.5)
-        rotating_pattern = 0.5 + 0.5 * math.sin(
-            angle * 3.8 + self._elapsed * 0.65 + lat * 6.0
-        )
-        turbulence = 0.5 + 0.5 * math.sin(angle * 6.2 - self._elapsed * 0.5)
-        cover = equatorial_band * rotating_pattern * 0.6 + turbulence * 0.25
-        return max(0.0, min(1.0, cover))
+    @staticmethod
+    def _wrapped_angle_distance(angle, reference):
+        """Shortest angular distance, elementwise on scalars or arrays.
 
-    def _mars_albedo(self, angle: float, lat: float) -> Tuple[float, float, float]:
-        """
-        Sharper albedo features for Mars: dark basins, bright highlands,
-        canyon band, polar caps, and dust storms with more contrast.
+        The blob-mask builders broadcast this over the whole sphere grid
+        when the static height/basin tables are assembled at init.
         """
-        # Base palettes
-        dark_basin = (0.35, 0.17, 0.10)      # Mare-like basalt
-        bright_highland = (0.80, 0.43, 0.24)  # Dusty highlands
-        mid_tone = (0.55, 0.28, 0.15)
 
-        # Large-scale basins
-        basin_strength = 0.0
-        for center_angle, center_lat, angular_width, strength in self.MARS_ALBEDO_FEATURES:
-            ang_dist = self._wrapped_angle_distance(angle, center_angle)
-            lat_dist = abs(lat - center_lat)
-            ang_falloff = max(0.0, 1.0 - (ang_dist / angular_width) ** 2)
-            lat_falloff = max(0.0, 1.0 - (lat_dist / 0.75) ** 2)
-            basin_strength += ang_falloff * lat_falloff * strength
-        basin_strength = max(0.0, min(1.0, basin_strength))
-
-        # Local detail
-        noise = math.sin(angle * 9.0 + lat * 15.0) * 0.25
-        # Highland factor – sharpened vs basins
-        highland_factor = self._clamp01((1.0 - basin_strength) * 1.2 + noise * 0.4)
-
-        r = mid_tone[0]
-        g = mid_tone[1]
-        b = mid_tone[2]
-
-        # Blend towards dark basins
-        r = self._lerp(r, dark_basin[0], basin_strength * 0.9)
-        g = self._lerp(g, dark_basin[1], basin_strength * 0.9)
-        b = self._lerp(b, dark_basin[2], basin_strength * 0.9)
-
-        # Blend towards bright dusty highlands
-        r = self._lerp(r, bright_highland[0], highland_factor * 0.9)
-        g = self._lerp(g, bright_highland[1], highland_factor * 0.9)
-        b = self._lerp(b, bright_highland[2], highland_factor * 0.9)
-
-        # Canyon band near equator
-        canyon_lat_band = max(0.0, 1.0 - abs(lat + 0.05) * 7.0)
-        canyon_long_wave = max(0.0, math.sin(angle * 3.1 - 0.4))
-        canyon = canyon_lat_band * canyon_long_wave
-        if canyon > 0.0:
-            r -= canyon * 0.22
-            g -= canyon * 0.14
-            b -= canyon * 0.10
-
-        # Time-varying dust storms (bright patches)
-        dust = 0.5 + 0.5 * math.sin(angle * 4.5 + self._elapsed * 0.7 + lat * 3.7)
-        dust *= 0.30
-        r += dust * 0.16
-        g += dust * 0.10
-        b += dust * 0.06
-
-        # Polar caps
-        ice = self._smoothstep(0.8, 0.93, abs(lat))
-        ice_color = (0.96, 0.97, 1.0)
-        r = self._lerp(r, ice_color[0], ice)
-        g = self._lerp(g, ice_color[1], ice)
-        b = self._lerp(b, ice_color[2], ice)
-
-        r = self._clamp01(r)
-        g = self._clamp01(g)
-        b = self._clamp01(b)
-        return (r, g, b)
-
-    @staticmethod
-    def _wrapped_angle_distance(angle: float, reference: float) -> float:
         distance = (angle - reference + math.pi) % math.tau - math.pi
-        return abs(distance)
+        return np.abs(distance)
 
 
 # ---------------------------------------------------------------------------
 # Additional fully 3D-rendered opening scene
 
 
-@dataclass
-class ForestTree:
-    """Single conifer-like tree for the 3D rendered forest opening scene."""
-
-    position: Vec2  # normalized (0-1) clearing coordinates
-    height: float
+@dataclass(slots=True, frozen=True)
+class ForestLayout:
+    """Forest trees stored as parallel arrays, StarField-style.
+
+    xs/depths are normalized (0-1) clearing coordinates; heights are the
+    per-tree scale factors.
+    """
+
+    xs: np.ndarray
+    depths: np.ndarray
+    heights: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
+@lru_cache(maxsize=2)
+def _forest_trees_for(count: int) -> ForestLayout:
+    """Generate (and memoize) the forest layout for ``count`` trees."""
+
+    rng = np.random.default_rng()
+    xs = np.empty(0)
+    depths = np.empty(0)
+    heights = np.empty(0)
+    while len(xs) < count:
+        batch_xs = rng.uniform(0.08, 0.92, count)
+        # Leave a clearing around the house footprint.
+        keep = np.abs(batch_xs - 0.5) >= 0.18
+        xs = np.concatenate((xs, batch_xs[keep]))
+        depths = np.concatenate((depths, rng.random(count)[keep]))
+        heights = np.concatenate((heights, rng.uniform(0.85, 1.15, count)[keep]))
+    layout = ForestLayout(
+        xs=xs[:count].astype(np.float32),
+        depths=depths[:count].astype(np.float32),
+        heights=heights[:count].astype(np.float32),
+    )
+    for column in (layout.xs, layout.depths, layout.heights):
+        column.setflags(write=False)
+    return layout
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneCamera:
     """Simple perspective camera used for the 3D vignette rendering."""
 
@@ -656,10 +1288,21 @@ class OpeningSceneCutscene:
         + SCENE1_ZOOM_DURATION
         + SCENE1_OUTRO_DURATION
     )
+    SCENE1_OUTRO_START = SCENE1_TOTAL_DURATION - SCENE1_OUTRO_DURATION
+
+    SCENE1_FLOOR_TILES_X = 9
+    SCENE1_FLOOR_TILES_Z = 10
+
+    SCENE1_HOUSE_CENTER = (0.0, 1.4, 0.2)
+    SCENE1_HOUSE_SIZE = (4.8, 2.6, 3.4)
+
+    SCENE2_TV_SCANLINES = 18
 
     SCENE2_FADE_IN_DURATION = 1.0
     SCENE2_INTERVIEW_SWITCHES = 5
     SCENE2_SWITCH_INTERVAL = 1.5
+    SCENE2_MAX_SWITCH_TIME = SCENE2_INTERVIEW_SWITCHES * SCENE2_SWITCH_INTERVAL
+    SCENE2_INV_SWITCH_INTERVAL = 1.0 / SCENE2_SWITCH_INTERVAL
     SCENE2_TV_FOCUS_DURATION = SCENE2_SWITCH_INTERVAL * (SCENE2_INTERVIEW_SWITCHES + 1) + 1.0
     SCENE2_PAN_DELAY = 0.6
     SCENE2_WINDOW_PAN_DURATION = 3.0
@@ -672,6 +1315,7 @@ class OpeningSceneCutscene:
         + SCENE2_FLASH_DURATION
         + SCENE2_OUTRO_DURATION
     )
+    SCENE2_OUTRO_START = SCENE2_TOTAL_DURATION - SCENE2_OUTRO_DURATION
 
     TOTAL_DURATION = SCENE1_TOTAL_DURATION + SCENE2_TOTAL_DURATION
 
@@ -679,8 +1323,21 @@ class OpeningSceneCutscene:
         pygame.font.init()
         self._viewport_size = viewport_size
         self._elapsed = 0.0
-        self._stars: List[Star] = self._generate_starfield(250)
-        self._trees: List[ForestTree] = self._generate_trees(45)
+        self._stars: StarField = self._generate_starfield(250)
+        # Star pixel positions depend only on the viewport, so they are
+        # rebuilt on resize instead of rescaled from normalized coordinates
+        # every frame; the color buffer persists with a fixed alpha column.
+        self._star_px = np.empty((len(self._stars), 2), dtype=np.float32)
+        self._star_rgba = np.empty((len(self._stars), 4), dtype=np.uint8)
+        self._star_rgba[:, 3] = 255
+        self._star_scratch = np.empty(len(self._stars), dtype=np.float32)
+        # The fade overlays are always a viewport-sized black quad; only the
+        # alpha changes per frame, so the geometry is rebuilt with the star
+        # positions on resize and the colour buffer persists.
+        self._fade_quad_xy = np.empty(8, dtype=np.float32)
+        self._fade_quad_rgba = np.zeros(16, dtype=np.uint8)
+        self._rebuild_star_px()
+        self._trees: ForestLayout = self._generate_trees(45)
         self._camera_jitter_phase = random.random() * math.tau
         self._flicker_offsets = (
             random.random() * math.tau,
@@ -688,6 +1345,47 @@ class OpeningSceneCutscene:
         )
         self._scene2_tv_scan_phase = random.random() * math.tau
         self._scene2_lamp_phase = random.random() * math.tau
+        # Forest-floor undulation never changes and the moss sway only varies
+        # per tile column, so precompute the static table and the per-column
+        # phases once instead of calling math.sin per tile per frame.
+        self._floor_undulation = tuple(
+            tuple(
+                math.sin(ix * 0.7 + iz * 0.9) * 0.1
+                for iz in range(self.SCENE1_FLOOR_TILES_Z)
+            )
+            for ix in range(self.SCENE1_FLOOR_TILES_X)
+        )
+        self._floor_moss_phase = np.arange(
+            self.SCENE1_FLOOR_TILES_X, dtype=np.float32
+        ) * 1.2
+        # The scene light directions never change, so normalize each once
+        # here instead of per draw call.
+        self._scene1_floor_light = self._normalized3((-0.35, -0.8, -0.45))
+        self._scene1_tree_light = self._normalized3((-0.25, -0.75, -0.35))
+        self._scene1_house_light = self._normalized3((-0.35, -0.7, -0.4))
+        self._scene2_room_light = self._normalized3((-0.2, -0.6, -0.8))
+        self._scene2_furniture_light = self._normalized3((-0.3, -0.7, -0.4))
+        self._scene2_tv_light = self._normalized3((-0.15, -0.7, -0.3))
+        self._scene2_window_light = self._normalized3((-0.1, -0.5, -0.9))
+        self._floor_tiles = self._build_floor_tiles()
+        self._house_static_faces = self._build_house_static_faces()
+        self._tree_faces = self._build_tree_faces()
+        self._furniture_faces = self._build_furniture_faces()
+        self._tv_faces = self._build_tv_faces()
+        # TV scanline phases and normalised row offsets are fixed; only the
+        # flicker alpha varies per frame, so that becomes one np.sin call.
+        self._scan_phases = np.arange(self.SCENE2_TV_SCANLINES, dtype=np.float32) * 0.5
+        self._scan_rows = (
+            np.arange(self.SCENE2_TV_SCANLINES, dtype=np.float32)
+            / self.SCENE2_TV_SCANLINES
+        )
+        # The picture frames on the back wall never move, so their face
+        # entries are built once instead of being reassembled every frame.
+        self._picture_frame_faces = self._build_picture_frame_faces()
+        # One reusable primitive batch for every per-frame accumulation;
+        # flush() empties it, so the typed storage survives across draws
+        # instead of being reallocated several times a frame.
+        self._batch = _PrimitiveBatch()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -709,6 +1407,7 @@ class OpeningSceneCutscene:
         gl.glLoadIdentity()
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+        _enable_vertex_arrays()
 
         if self._elapsed < self.SCENE1_TOTAL_DURATION:
             self._draw_scene1()
@@ -720,6 +1419,7 @@ class OpeningSceneCutscene:
             self._draw_scene2(scene2_time)
             self._draw_scene2_fade_overlay(scene2_time)
 
+        _disable_vertex_arrays()
         gl.glDisable(gl.GL_BLEND)
         gl.glEnable(gl.GL_DEPTH_TEST)
 
@@ -738,73 +1438,145 @@ class OpeningSceneCutscene:
         self._draw_scene2_window(scene_time, camera)
 
     def update_viewport(self, viewport_size: Tuple[int, int]) -> None:
+        if viewport_size == self._viewport_size:
+            return
         self._viewport_size = viewport_size
+        self._rebuild_star_px()
 
     def is_finished(self) -> bool:
         return self._elapsed >= self.TOTAL_DURATION
 
     # ------------------------------------------------------------------
     # Scene 1 helpers
+    def _rebuild_star_px(self) -> None:
+        width, height = self._viewport_size
+        # Scene one only scatters stars across the upper night sky.
+        self._star_px[:, 0] = self._stars.xs * width
+        self._star_px[:, 1] = self._stars.ys * (height * 0.55)
+        self._fade_quad_xy[:] = (0.0, 0.0, width, 0.0, width, height, 0.0, height)
+
     def _draw_scene1_background(self) -> None:
         width, height = self._viewport_size
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.01, 0.01, 0.08, 1.0)
-        gl.glVertex2f(0.0, 0.0)
-        gl.glVertex2f(width, 0.0)
-        gl.glColor4f(0.0, 0.0, 0.02, 1.0)
-        gl.glVertex2f(width, height)
-        gl.glVertex2f(0.0, height)
-        gl.glEnd()
+        _draw_vertex_array(
+            gl.GL_QUADS,
+            (0.0, 0.0, width, 0.0, width, height, 0.0, height),
+            (2, 2, 20, 255, 2, 2, 20, 255, 0, 0, 5, 255, 0, 0, 5, 255),
+        )
 
         gl.glPointSize(2.0)
-        gl.glBegin(gl.GL_POINTS)
-        for star in self._stars:
-            twinkle = math.sin(self._elapsed * star.twinkle_speed + star.phase)
-            brightness = max(0.0, min(1.0, star.base_brightness + twinkle * 0.35))
-            gl.glColor4f(brightness, brightness, brightness * 1.2, 1.0)
-            gl.glVertex2f(star.position[0] * width, star.position[1] * height * 0.55)
-        gl.glEnd()
+        stars = self._stars
+        # Positions come from the viewport-keyed cache; only the twinkle
+        # channels change frame to frame, computed in-place in the scratch
+        # column so the star pass allocates nothing.
+        scratch = self._star_scratch
+        np.multiply(stars.twinkle_speed, self._elapsed, out=scratch)
+        scratch += stars.phase
+        np.sin(scratch, out=scratch)
+        scratch *= 0.35
+        scratch += stars.base_brightness
+        np.clip(scratch, 0.0, 1.0, out=scratch)
+        scratch *= 255.0
+        star_rgba = self._star_rgba
+        star_rgba[:, 0] = scratch
+        star_rgba[:, 1] = scratch
+        scratch *= 1.2
+        np.minimum(scratch, 255.0, out=scratch)
+        star_rgba[:, 2] = scratch
+        _draw_vertex_array(
+            gl.GL_POINTS, self._star_px.reshape(-1), star_rgba.reshape(-1)
+        )
+
+    def _build_floor_tiles(
+        self,
+    ) -> Tuple[Tuple[Tuple[Tuple[float, ...], ...], ...], ...]:
+        """Precompute the static corner/colour table for the forest floor.
+
+        Tile corners, undulation heights, and base colours never change;
+        only the per-column moss sway moves, so the frame loop just adds the
+        moss offsets to these cached values.
+        """
 
-    def _draw_scene1_forest_floor(self, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.35, -0.8, -0.45))
-        tile_count_x = 9
-        tile_count_z = 10
         tile_size_x = 1.8
         tile_size_z = 1.6
-        start_x = -tile_count_x * tile_size_x * 0.5
+        start_x = -self.SCENE1_FLOOR_TILES_X * tile_size_x * 0.5
         start_z = -3.8
-        faces = []
-        for ix in range(tile_count_x):
-            for iz in range(tile_count_z):
-                x0 = start_x + ix * tile_size_x
-                x1 = x0 + tile_size_x
+        columns = []
+        for ix in range(self.SCENE1_FLOOR_TILES_X):
+            undulation_column = self._floor_undulation[ix]
+            x0 = start_x + ix * tile_size_x
+            x1 = x0 + tile_size_x
+            column = []
+            for iz in range(self.SCENE1_FLOOR_TILES_Z):
                 z0 = start_z + iz * tile_size_z
                 z1 = z0 + tile_size_z
-                undulation = math.sin(ix * 0.7 + iz * 0.9) * 0.1
-                moss = math.sin(ix * 1.2 + self._elapsed * 0.4) * 0.04
-                vertices = [
-                    (x0, undulation * 0.5 + moss, z0),
-                    (x1, undulation * 0.2 + moss * 0.5, z0),
-                    (x1, undulation * 0.1 + moss * 0.2, z1),
-                    (x0, undulation * 0.4 + moss * 0.9, z1),
-                ]
+                undulation = undulation_column[iz]
                 base_color = (
                     0.05 + ix * 0.005,
                     0.14 + iz * 0.008,
                     0.07 + undulation * 0.2,
                 )
-                wire_color = (0.28, 0.45, 0.3, 0.7)
+                column.append(
+                    (
+                        (x0, undulation * 0.5, z0),
+                        (x1, undulation * 0.2, z0),
+                        (x1, undulation * 0.1, z1),
+                        (x0, undulation * 0.4, z1),
+                        base_color,
+                    )
+                )
+            columns.append(tuple(column))
+        return tuple(columns)
+
+    def _draw_scene1_forest_floor(self, camera: SceneCamera) -> None:
+        light_dir = self._scene1_floor_light
+        # One vectorized sin call covers every column's moss sway this frame.
+        moss_row = (
+            np.sin(self._floor_moss_phase + self._elapsed * 0.4) * 0.04
+        ).tolist()
+        wire_color = (0.28, 0.45, 0.3, 0.7)
+        faces = []
+        for column, moss in zip(self._floor_tiles, moss_row):
+            moss_half = moss * 0.5
+            moss_fifth = moss * 0.2
+            moss_nine = moss * 0.9
+            for v0, v1, v2, v3, base_color in column:
+                vertices = [
+                    (v0[0], v0[1] + moss, v0[2]),
+                    (v1[0], v1[1] + moss_half, v1[2]),
+                    (v2[0], v2[1] + moss_fifth, v2[2]),
+                    (v3[0], v3[1] + moss_nine, v3[2]),
+                ]
                 faces.append((vertices, base_color, 0.92, wire_color))
         self._render_face_batch(faces, camera, light_dir)
 
     def _draw_scene1_trees(self, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.25, -0.75, -0.35))
+        light_dir = self._scene1_tree_light
+        self._render_face_batch(self._tree_faces, camera, light_dir)
+
+    def _build_tree_faces(
+        self,
+    ) -> Tuple[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]], ...]:
+        """Assemble every tree's trunk and canopy faces in one pass.
+
+        The forest never moves, so all per-tree geometry and colours are
+        computed here once; the per-frame cost is just projecting the cached
+        faces through the current camera.
+        """
+
+        trees = self._trees
+        # Emit trees back-to-front once; the camera only jitters slightly, so
+        # the per-frame depth sort in _render_face_batch then runs over
+        # almost-sorted input, which timsort handles in near-linear time.
+        order = np.argsort(trees.depths)[::-1]
         faces: List[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]] = []
-        for tree in self._trees:
-            depth = tree.position[1]
-            base_x = (tree.position[0] - 0.5) * 10.0
+        for x, depth, tree_height in zip(
+            trees.xs[order].tolist(),
+            trees.depths[order].tolist(),
+            trees.heights[order].tolist(),
+        ):
+            base_x = (x - 0.5) * 10.0
             base_z = -1.8 + depth * 7.5
-            trunk_height = 2.4 * tree.height
+            trunk_height = 2.4 * tree_height
             trunk_center = (base_x, trunk_height * 0.5, base_z)
             trunk_size = (0.35 * (0.8 + depth * 0.4), trunk_height, 0.35 * (0.8 + depth * 0.4))
             trunk_color = (0.1 + depth * 0.2, 0.06 + depth * 0.1, 0.04 + depth * 0.08)
@@ -833,12 +1605,19 @@ class OpeningSceneCutscene:
                     (0.05 + color_scale, 0.25 + color_scale * 0.5, 0.08 + color_scale * 0.3),
                     (0.4, 0.75, 0.4, 0.8),
                 )
-        self._render_face_batch(faces, camera, light_dir)
+        return tuple(faces)
 
-    def _draw_scene1_house(self, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.35, -0.7, -0.4))
-        body_center = (0.0, 1.4, 0.2)
-        body_size = (4.8, 2.6, 3.4)
+    def _build_house_static_faces(
+        self,
+    ) -> Tuple[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]], ...]:
+        """Build the cottage faces that never change between frames.
+
+        Only the window flicker varies over time, so the body, roof, door,
+        and walkway face entries are assembled once and reused every frame.
+        """
+
+        body_center = self.SCENE1_HOUSE_CENTER
+        body_size = self.SCENE1_HOUSE_SIZE
         faces: List[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]] = []
         self._append_prism_faces(
             faces,
@@ -886,26 +1665,9 @@ class OpeningSceneCutscene:
             (0.85, 0.7, 0.6, 0.9),
         ))
 
-        flicker = 0.65
-        flicker += 0.25 * math.sin(self._elapsed * 8.7 + self._flicker_offsets[0])
-        flicker += 0.15 * math.sin(self._elapsed * 15.3 + self._flicker_offsets[1])
-        flicker += 0.1 * math.sin(self._elapsed * 24.1 + self._camera_jitter_phase * 0.5)
-        flicker = self._clamp01(flicker)
-        window_light = (0.1 * flicker, 0.35 * flicker, 0.9 * flicker)
-        window_width = 0.7
-        window_height = 0.9
-        front_z = body_center[2] + body_size[2] / 2 + 0.01
-        for offset in (-1.25, 1.25):
-            frame = [
-                (offset - window_width / 2, top_y - 0.6, front_z),
-                (offset + window_width / 2, top_y - 0.6, front_z),
-                (offset + window_width / 2, top_y - window_height - 0.6, front_z),
-                (offset - window_width / 2, top_y - window_height - 0.6, front_z),
-            ]
-            faces.append((frame, window_light, 0.95, (0.4, 0.6, 0.95, 0.8)))
-
         door_width = 1.0
         door_height = 1.7
+        front_z = body_center[2] + body_size[2] / 2 + 0.01
         door = [
             (-door_width / 2, body_center[1] - body_size[1] / 2 + door_height, front_z),
             (door_width / 2, body_center[1] - body_size[1] / 2 + door_height, front_z),
@@ -921,13 +1683,39 @@ class OpeningSceneCutscene:
             (-1.6, 0.0, body_center[2] + body_size[2] / 2 + 2.4),
         ]
         faces.append((walkway, (0.25, 0.2, 0.15), 0.85, (0.6, 0.45, 0.3, 0.7)))
+        return tuple(faces)
+
+    def _draw_scene1_house(self, camera: SceneCamera) -> None:
+        light_dir = self._scene1_house_light
+        body_center = self.SCENE1_HOUSE_CENTER
+        body_size = self.SCENE1_HOUSE_SIZE
+        faces = list(self._house_static_faces)
+        top_y = body_center[1] + body_size[1] / 2
+
+        flicker = 0.65
+        flicker += 0.25 * math.sin(self._elapsed * 8.7 + self._flicker_offsets[0])
+        flicker += 0.15 * math.sin(self._elapsed * 15.3 + self._flicker_offsets[1])
+        flicker += 0.1 * math.sin(self._elapsed * 24.1 + self._camera_jitter_phase * 0.5)
+        flicker = self._clamp01(flicker)
+        window_light = (0.1 * flicker, 0.35 * flicker, 0.9 * flicker)
+        window_width = 0.7
+        window_height = 0.9
+        front_z = body_center[2] + body_size[2] / 2 + 0.01
+        for offset in (-1.25, 1.25):
+            frame = [
+                (offset - window_width / 2, top_y - 0.6, front_z),
+                (offset + window_width / 2, top_y - 0.6, front_z),
+                (offset + window_width / 2, top_y - window_height - 0.6, front_z),
+                (offset - window_width / 2, top_y - window_height - 0.6, front_z),
+            ]
+            faces.append((frame, window_light, 0.95, (0.4, 0.6, 0.95, 0.8)))
 
         self._render_face_batch(faces, camera, light_dir)
 
     def _draw_scene1_fade_overlay(self) -> None:
         scene_time = min(self._elapsed, self.SCENE1_TOTAL_DURATION)
         fade_in = 1.0 - min(1.0, scene_time / self.SCENE1_FADE_IN_DURATION)
-        outro_start = self.SCENE1_TOTAL_DURATION - self.SCENE1_OUTRO_DURATION
+        outro_start = self.SCENE1_OUTRO_START
         fade_out = 0.0
         if scene_time > outro_start:
             fade_out = min(
@@ -938,14 +1726,8 @@ class OpeningSceneCutscene:
         fade_amount = max(fade_in, fade_out)
         if fade_amount <= 0.0:
             return
-        width, height = self._viewport_size
-        gl.glColor4f(0.0, 0.0, 0.0, fade_amount)
-        gl.glBegin(gl.GL_QUADS)
-        gl.glVertex2f(0.0, 0.0)
-        gl.glVertex2f(width, 0.0)
-        gl.glVertex2f(width, height)
-        gl.glVertex2f(0.0, height)
-        gl.glEnd()
+        self._fade_quad_rgba[3::4] = int(self._clamp01(fade_amount) * 255)
+        _draw_vertex_array(gl.GL_TRIANGLE_FAN, self._fade_quad_xy, self._fade_quad_rgba)
 
     # ------------------------------------------------------------------
     # Scene 2 helpers
@@ -957,7 +1739,7 @@ class OpeningSceneCutscene:
         room_height = self.SCENE2_ROOM_HEIGHT
         front_z = 2.0
         back_z = -room_depth
-        light_dir = self._normalized3((-0.2, -0.6, -0.8))
+        light_dir = self._scene2_room_light
         faces: List[
             Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]
         ] = []
@@ -1058,23 +1840,43 @@ class OpeningSceneCutscene:
         ]
         faces.append((panel, (0.1, 0.12, 0.18), 0.8, (0.45, 0.5, 0.65, 0.55)))
 
+        faces.extend(self._picture_frame_faces)
+
+        self._render_face_batch(faces, camera, light_dir)
+
+    @classmethod
+    def _build_picture_frame_faces(
+        cls,
+    ) -> Tuple[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]], ...]:
+        """Build the static back-wall picture-frame quads once."""
+
         frame_height = 1.4
         frame_width = 0.9
+        frame_x = -cls.SCENE2_ROOM_WIDTH / 2 + 0.6
+        wall_z = -cls.SCENE2_ROOM_DEPTH + 0.02
+        frames = []
         for index in range(3):
-            frame_x = -room_width / 2 + 0.6
             offset_y = 1.2 + index * 0.6
             art = [
-                (frame_x + 0.01, offset_y + frame_height, -room_depth + 0.02),
-                (frame_x + frame_width, offset_y + frame_height, -room_depth + 0.02),
-                (frame_x + frame_width, offset_y, -room_depth + 0.02),
-                (frame_x + 0.01, offset_y, -room_depth + 0.02),
+                (frame_x + 0.01, offset_y + frame_height, wall_z),
+                (frame_x + frame_width, offset_y + frame_height, wall_z),
+                (frame_x + frame_width, offset_y, wall_z),
+                (frame_x + 0.01, offset_y, wall_z),
             ]
-            faces.append((art, (0.15 + index * 0.05, 0.12, 0.18 + index * 0.03), 0.75, (0.6, 0.5, 0.4, 0.7)))
-
-        self._render_face_batch(faces, camera, light_dir)
+            frames.append(
+                (art, (0.15 + index * 0.05, 0.12, 0.18 + index * 0.03), 0.75, (0.6, 0.5, 0.4, 0.7))
+            )
+        return tuple(frames)
 
     def _draw_scene2_furniture(self, scene_time: float, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.3, -0.7, -0.4))
+        light_dir = self._scene2_furniture_light
+        self._render_face_batch(self._furniture_faces, camera, light_dir)
+
+    def _build_furniture_faces(
+        self,
+    ) -> Tuple[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]], ...]:
+        """Build the static sofa/table/vase faces once at construction."""
+
         faces: List[
             Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]
         ] = []
@@ -1165,11 +1967,13 @@ class OpeningSceneCutscene:
             (0.3, 0.55, 0.35),
             (0.4, 0.7, 0.45, 0.8),
         )
+        return tuple(faces)
 
-        self._render_face_batch(faces, camera, light_dir)
+    def _build_tv_faces(
+        self,
+    ) -> Tuple[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]], ...]:
+        """Build the static TV bezel, stand, and dark screen faces once."""
 
-    def _draw_scene2_tv(self, scene_time: float, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.15, -0.7, -0.3))
         room_depth = self.SCENE2_ROOM_DEPTH
         faces: List[
             Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]
@@ -1205,9 +2009,14 @@ class OpeningSceneCutscene:
             (tv_center[0] - screen_width / 2, tv_center[1] - screen_height / 2, screen_z),
         ]
         faces.append((screen_vertices, (0.02, 0.04, 0.09), 1.0, (0.4, 0.55, 0.8, 0.95)))
+        return tuple(faces)
 
-        self._render_face_batch(faces, camera, light_dir)
+    def _draw_scene2_tv(self, scene_time: float, camera: SceneCamera) -> None:
+        light_dir = self._scene2_tv_light
+        self._render_face_batch(self._tv_faces, camera, light_dir)
 
+        # The screen quad is the last entry in the cached face tuple.
+        screen_vertices = self._tv_faces[-1][0]
         projected_screen = self._project_polygon(screen_vertices, camera)
         if not projected_screen:
             return
@@ -1218,32 +2027,40 @@ class OpeningSceneCutscene:
         chatter *= 0.7 + 0.3 * math.sin(self._elapsed * 8.0 + self._scene2_tv_scan_phase)
         chatter = self._clamp01(chatter)
 
+        batch = self._batch
         if speaker_index == 0:
-            self._draw_scene2_portrait_reporter(screen_rect, chatter)
+            self._draw_scene2_portrait_reporter(screen_rect, chatter, batch)
         else:
-            self._draw_scene2_portrait_host(screen_rect, chatter)
-
-        scanlines = 18
-        gl.glBegin(gl.GL_LINES)
-        for i in range(scanlines):
-            y = screen_rect[1] + (i / scanlines) * screen_rect[3]
-            alpha = 0.08 + 0.05 * math.sin(self._elapsed * 12.0 + i * 0.5)
-            gl.glColor4f(0.9, 0.9, 1.0, alpha)
-            gl.glVertex2f(screen_rect[0], y)
-            gl.glVertex2f(screen_rect[0] + screen_rect[2], y)
-        gl.glEnd()
+            self._draw_scene2_portrait_host(screen_rect, chatter, batch)
+
+        line_x0 = screen_rect[0]
+        line_x1 = screen_rect[0] + screen_rect[2]
+        scan_ys = (screen_rect[1] + self._scan_rows * screen_rect[3]).tolist()
+        scan_alpha_arr = 0.08 + 0.05 * np.sin(self._elapsed * 12.0 + self._scan_phases)
+        # Invisible overlays still cost full-screen blend fill, so skip them
+        # outright when every alpha rounds to zero.
+        if scan_alpha_arr.max() > 1.0 / 255.0:
+            scan_alphas = scan_alpha_arr.tolist()
+            for y, alpha in zip(scan_ys, scan_alphas):
+                batch.add_line(
+                    (line_x0, y), (line_x1, y), _rgba8(0.9, 0.9, 1.0, alpha)
+                )
 
         noise_alpha = 0.03 + 0.04 * math.sin(self._elapsed * 20.0)
-        gl.glColor4f(1.0, 1.0, 1.0, noise_alpha)
-        gl.glBegin(gl.GL_QUADS)
-        gl.glVertex2f(screen_rect[0], screen_rect[1])
-        gl.glVertex2f(screen_rect[0] + screen_rect[2], screen_rect[1])
-        gl.glVertex2f(screen_rect[0] + screen_rect[2], screen_rect[1] + screen_rect[3])
-        gl.glVertex2f(screen_rect[0], screen_rect[1] + screen_rect[3])
-        gl.glEnd()
+        if noise_alpha > 1.0 / 255.0:
+            batch.add_quad(
+                (
+                    (screen_rect[0], screen_rect[1]),
+                    (screen_rect[0] + screen_rect[2], screen_rect[1]),
+                    (screen_rect[0] + screen_rect[2], screen_rect[1] + screen_rect[3]),
+                    (screen_rect[0], screen_rect[1] + screen_rect[3]),
+                ),
+                _rgba8(1.0, 1.0, 1.0, noise_alpha),
+            )
+        batch.flush()
 
     def _draw_scene2_window(self, scene_time: float, camera: SceneCamera) -> None:
-        light_dir = self._normalized3((-0.1, -0.5, -0.9))
+        light_dir = self._scene2_window_light
         room_depth = self.SCENE2_ROOM_DEPTH
         room_width = self.SCENE2_ROOM_WIDTH
         window_size = (2.8, 3.0)
@@ -1321,6 +2138,7 @@ class OpeningSceneCutscene:
         self._draw_projected_line(mullion_left, mullion_right, camera, mullion_color)
 
         glass_polygon = self._project_polygon(glass_vertices, camera)
+        overlay_batch = self._batch
         meteor_time = scene_time - (self.SCENE2_TV_FOCUS_DURATION + self.SCENE2_PAN_DELAY)
         if meteor_time > 0.0:
             flight_duration = self.SCENE2_WINDOW_PAN_DURATION * 0.85
@@ -1335,176 +2153,185 @@ class OpeningSceneCutscene:
                 meteor_pos[1] - window_size[1] * 0.18,
                 meteor_pos[2] - 0.2,
             )
-            self._draw_projected_line(tail_pos, meteor_pos, camera, (1.0, 0.72, 0.25, 0.9))
+            # Tail and head both land in the overlay batch so the meteor
+            # costs no draw calls of its own.
             meteor_projected = self._project_point(meteor_pos, camera)
+            tail_projected = self._project_point(tail_pos, camera)
+            if meteor_projected is not None and tail_projected is not None:
+                overlay_batch.add_line(
+                    (tail_projected[0], tail_projected[1]),
+                    (meteor_projected[0], meteor_projected[1]),
+                    _rgba8(1.0, 0.72, 0.25, 0.9),
+                )
             if meteor_projected is not None:
                 glow_radius = self._viewport_size[0] * 0.012
-                gl.glBegin(gl.GL_TRIANGLE_FAN)
-                gl.glColor4f(1.0, 0.8, 0.3, 0.85)
-                gl.glVertex2f(meteor_projected[0], meteor_projected[1])
-                for angle in range(0, 361, 40):
-                    rad = math.radians(angle)
-                    gl.glVertex2f(
-                        meteor_projected[0] + math.cos(rad) * glow_radius,
-                        meteor_projected[1] + math.sin(rad) * glow_radius,
-                    )
-                gl.glEnd()
+                overlay_batch.add_disk(
+                    (meteor_projected[0], meteor_projected[1]),
+                    (glow_radius, glow_radius),
+                    40,
+                    _rgba8(1.0, 0.8, 0.3, 0.85),
+                )
 
         flash_intensity = self._scene2_flash_strength(scene_time)
         if flash_intensity > 0.0 and glass_polygon:
-            gl.glBegin(gl.GL_POLYGON)
-            gl.glColor4f(1.0, 0.55, 0.12, 0.35 + 0.4 * flash_intensity)
-            for x, y in glass_polygon:
-                gl.glVertex2f(x, y)
-            gl.glEnd()
+            overlay_batch.add_polygon(
+                glass_polygon,
+                _rgba8(1.0, 0.55, 0.12, 0.35 + 0.4 * flash_intensity),
+            )
+        overlay_batch.flush()
 
-    def _draw_scene2_portrait_reporter(self, rect: Tuple[float, float, float, float], chatter: float) -> None:
+    def _draw_scene2_portrait_reporter(
+        self,
+        rect: Tuple[float, float, float, float],
+        chatter: float,
+        batch: _PrimitiveBatch,
+    ) -> None:
         x, y, w, h = rect
         face_center = (x + w * 0.58, y + h * 0.45)
         radius = w * 0.18
 
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glColor4f(0.72, 0.28, 0.42, 0.95)
-        gl.glVertex2f(face_center[0], face_center[1])
-        for angle in range(0, 361, 15):
-            rad = math.radians(angle)
-            offset = 1.0 + 0.2 * math.sin(angle * 2.0)
-            gl.glVertex2f(
-                face_center[0] - radius * 0.3 + math.cos(rad) * radius * 1.15,
-                face_center[1] + math.sin(rad) * radius * 1.25 * offset,
-            )
-        gl.glEnd()
-
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glColor4f(0.98, 0.85, 0.78, 1.0)
-        gl.glVertex2f(face_center[0], face_center[1])
-        for angle in range(0, 361, 12):
-            rad = math.radians(angle)
-            gl.glVertex2f(
-                face_center[0] + math.cos(rad) * radius,
-                face_center[1] + math.sin(rad) * radius * 1.1,
+        hair_points: List[Vec2] = [face_center]
+        for dx, dy in _REPORTER_HAIR_OFFSETS:
+            hair_points.append(
+                (
+                    face_center[0] - radius * 0.3 + dx * radius,
+                    face_center[1] + dy * radius,
+                )
             )
-        gl.glEnd()
+        batch.add_polygon(hair_points, _rgba8(0.72, 0.28, 0.42, 0.95))
+
+        batch.add_disk(
+            face_center, (radius, radius * 1.1), 12, _rgba8(0.98, 0.85, 0.78, 1.0)
+        )
 
         shoulder_y = y + h * 0.75
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.55, 0.35, 0.6, 1.0)
-        gl.glVertex2f(x + w * 0.25, shoulder_y)
-        gl.glVertex2f(x + w * 0.9, shoulder_y)
-        gl.glVertex2f(x + w * 0.9, shoulder_y + h * 0.2)
-        gl.glVertex2f(x + w * 0.25, shoulder_y + h * 0.2)
-        gl.glEnd()
-
-        gl.glBegin(gl.GL_LINES)
-        gl.glColor4f(0.2, 0.08, 0.06, 1.0)
+        batch.add_quad(
+            (
+                (x + w * 0.25, shoulder_y),
+                (x + w * 0.9, shoulder_y),
+                (x + w * 0.9, shoulder_y + h * 0.2),
+                (x + w * 0.25, shoulder_y + h * 0.2),
+            ),
+            _rgba8(0.55, 0.35, 0.6, 1.0),
+        )
+
+        eye_rgba = _rgba8(0.2, 0.08, 0.06, 1.0)
         eye_y = face_center[1] - radius * 0.15
         eye_x = face_center[0] + radius * 0.2
-        gl.glVertex2f(eye_x - radius * 0.1, eye_y)
-        gl.glVertex2f(eye_x + radius * 0.05, eye_y - radius * 0.05)
-        gl.glVertex2f(eye_x - radius * 0.35, eye_y + radius * 0.02)
-        gl.glVertex2f(eye_x - radius * 0.18, eye_y - radius * 0.04)
-        gl.glEnd()
+        batch.add_line(
+            (eye_x - radius * 0.1, eye_y),
+            (eye_x + radius * 0.05, eye_y - radius * 0.05),
+            eye_rgba,
+        )
+        batch.add_line(
+            (eye_x - radius * 0.35, eye_y + radius * 0.02),
+            (eye_x - radius * 0.18, eye_y - radius * 0.04),
+            eye_rgba,
+        )
 
         mouth_height = radius * 0.05 + chatter * radius * 0.08
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.8, 0.2, 0.3, 1.0)
-        gl.glVertex2f(face_center[0] - radius * 0.1, face_center[1] + radius * 0.25)
-        gl.glVertex2f(face_center[0] + radius * 0.15, face_center[1] + radius * 0.2)
-        gl.glVertex2f(
-            face_center[0] + radius * 0.15,
-            face_center[1] + radius * 0.2 + mouth_height,
-        )
-        gl.glVertex2f(
-            face_center[0] - radius * 0.1,
-            face_center[1] + radius * 0.25 + mouth_height,
+        batch.add_quad(
+            (
+                (face_center[0] - radius * 0.1, face_center[1] + radius * 0.25),
+                (face_center[0] + radius * 0.15, face_center[1] + radius * 0.2),
+                (
+                    face_center[0] + radius * 0.15,
+                    face_center[1] + radius * 0.2 + mouth_height,
+                ),
+                (
+                    face_center[0] - radius * 0.1,
+                    face_center[1] + radius * 0.25 + mouth_height,
+                ),
+            ),
+            _rgba8(0.8, 0.2, 0.3, 1.0),
         )
-        gl.glEnd()
 
-    def _draw_scene2_portrait_host(self, rect: Tuple[float, float, float, float], chatter: float) -> None:
+    def _draw_scene2_portrait_host(
+        self,
+        rect: Tuple[float, float, float, float],
+        chatter: float,
+        batch: _PrimitiveBatch,
+    ) -> None:
         x, y, w, h = rect
         face_center = (x + w * 0.42, y + h * 0.46)
         radius = w * 0.2
 
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glColor4f(0.82, 0.82, 0.88, 0.95)
-        gl.glVertex2f(face_center[0], face_center[1] - radius * 0.1)
-        for angle in range(0, 361, 15):
-            rad = math.radians(angle)
-            gl.glVertex2f(
-                face_center[0] + math.cos(rad) * radius * 1.2,
-                face_center[1] + math.sin(rad) * radius * 0.8,
-            )
-        gl.glEnd()
-
-        gl.glBegin(gl.GL_TRIANGLE_FAN)
-        gl.glColor4f(0.9, 0.82, 0.74, 1.0)
-        gl.glVertex2f(face_center[0], face_center[1])
-        for angle in range(0, 361, 12):
-            rad = math.radians(angle)
-            gl.glVertex2f(
-                face_center[0] + math.cos(rad) * radius * 0.95,
-                face_center[1] + math.sin(rad) * radius * 1.05,
-            )
-        gl.glEnd()
+        batch.add_disk(
+            face_center, (radius * 1.2, radius * 0.8), 15, _rgba8(0.82, 0.82, 0.88, 0.95)
+        )
+
+        batch.add_disk(
+            face_center, (radius * 0.95, radius * 1.05), 12, _rgba8(0.9, 0.82, 0.74, 1.0)
+        )
 
         suit_y = y + h * 0.78
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.12, 0.16, 0.22, 1.0)
-        gl.glVertex2f(x + w * 0.05, suit_y)
-        gl.glVertex2f(x + w * 0.82, suit_y)
-        gl.glVertex2f(x + w * 0.82, suit_y + h * 0.22)
-        gl.glVertex2f(x + w * 0.05, suit_y + h * 0.22)
-        gl.glEnd()
-
-        gl.glBegin(gl.GL_TRIANGLES)
-        gl.glColor4f(0.85, 0.85, 0.9, 1.0)
-        gl.glVertex2f(x + w * 0.28, suit_y)
-        gl.glVertex2f(x + w * 0.45, suit_y)
-        gl.glVertex2f(x + w * 0.36, suit_y - h * 0.15)
-        gl.glEnd()
-
-        gl.glBegin(gl.GL_LINES)
-        gl.glColor4f(0.18, 0.08, 0.05, 1.0)
+        batch.add_quad(
+            (
+                (x + w * 0.05, suit_y),
+                (x + w * 0.82, suit_y),
+                (x + w * 0.82, suit_y + h * 0.22),
+                (x + w * 0.05, suit_y + h * 0.22),
+            ),
+            _rgba8(0.12, 0.16, 0.22, 1.0),
+        )
+
+        batch.add_triangle(
+            (x + w * 0.28, suit_y),
+            (x + w * 0.45, suit_y),
+            (x + w * 0.36, suit_y - h * 0.15),
+            _rgba8(0.85, 0.85, 0.9, 1.0),
+        )
+
+        eye_rgba = _rgba8(0.18, 0.08, 0.05, 1.0)
         eye_y = face_center[1] - radius * 0.18
-        gl.glVertex2f(face_center[0] - radius * 0.05, eye_y)
-        gl.glVertex2f(face_center[0] + radius * 0.1, eye_y + radius * 0.02)
-        gl.glVertex2f(face_center[0] - radius * 0.28, eye_y + radius * 0.04)
-        gl.glVertex2f(face_center[0] - radius * 0.12, eye_y + radius * 0.02)
-        gl.glEnd()
+        batch.add_line(
+            (face_center[0] - radius * 0.05, eye_y),
+            (face_center[0] + radius * 0.1, eye_y + radius * 0.02),
+            eye_rgba,
+        )
+        batch.add_line(
+            (face_center[0] - radius * 0.28, eye_y + radius * 0.04),
+            (face_center[0] - radius * 0.12, eye_y + radius * 0.02),
+            eye_rgba,
+        )
 
         moustache_height = h * 0.01 + chatter * h * 0.01
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.3, 0.2, 0.15, 1.0)
-        gl.glVertex2f(face_center[0] - radius * 0.25, face_center[1] + radius * 0.15)
-        gl.glVertex2f(face_center[0] - radius * 0.05, face_center[1] + radius * 0.1)
-        gl.glVertex2f(
-            face_center[0] - radius * 0.05,
-            face_center[1] + radius * 0.1 + moustache_height,
-        )
-        gl.glVertex2f(
-            face_center[0] - radius * 0.25,
-            face_center[1] + radius * 0.15 + moustache_height,
+        batch.add_quad(
+            (
+                (face_center[0] - radius * 0.25, face_center[1] + radius * 0.15),
+                (face_center[0] - radius * 0.05, face_center[1] + radius * 0.1),
+                (
+                    face_center[0] - radius * 0.05,
+                    face_center[1] + radius * 0.1 + moustache_height,
+                ),
+                (
+                    face_center[0] - radius * 0.25,
+                    face_center[1] + radius * 0.15 + moustache_height,
+                ),
+            ),
+            _rgba8(0.3, 0.2, 0.15, 1.0),
         )
-        gl.glEnd()
 
         mouth_width = radius * 0.2
-        gl.glBegin(gl.GL_QUADS)
-        gl.glColor4f(0.7, 0.2, 0.25, 1.0)
-        gl.glVertex2f(face_center[0] - mouth_width, face_center[1] + radius * 0.2)
-        gl.glVertex2f(face_center[0] - mouth_width * 0.2, face_center[1] + radius * 0.18)
-        gl.glVertex2f(
-            face_center[0] - mouth_width * 0.2,
-            face_center[1] + radius * 0.18 + chatter * radius * 0.1,
-        )
-        gl.glVertex2f(
-            face_center[0] - mouth_width,
-            face_center[1] + radius * 0.2 + chatter * radius * 0.1,
+        batch.add_quad(
+            (
+                (face_center[0] - mouth_width, face_center[1] + radius * 0.2),
+                (face_center[0] - mouth_width * 0.2, face_center[1] + radius * 0.18),
+                (
+                    face_center[0] - mouth_width * 0.2,
+                    face_center[1] + radius * 0.18 + chatter * radius * 0.1,
+                ),
+                (
+                    face_center[0] - mouth_width,
+                    face_center[1] + radius * 0.2 + chatter * radius * 0.1,
+                ),
+            ),
+            _rgba8(0.7, 0.2, 0.25, 1.0),
         )
-        gl.glEnd()
 
     def _draw_scene2_fade_overlay(self, scene_time: float) -> None:
         fade_in = 1.0 - min(1.0, scene_time / self.SCENE2_FADE_IN_DURATION)
-        outro_start = self.SCENE2_TOTAL_DURATION - self.SCENE2_OUTRO_DURATION
+        outro_start = self.SCENE2_OUTRO_START
         fade_out = 0.0
         if scene_time > outro_start:
             fade_out = min(
@@ -1515,14 +2342,8 @@ class OpeningSceneCutscene:
         fade_amount = max(fade_in, fade_out)
         if fade_amount <= 0.0:
             return
-        width, height = self._viewport_size
-        gl.glColor4f(0.0, 0.0, 0.0, fade_amount)
-        gl.glBegin(gl.GL_QUADS)
-        gl.glVertex2f(0.0, 0.0)
-        gl.glVertex2f(width, 0.0)
-        gl.glVertex2f(width, height)
-        gl.glVertex2f(0.0, height)
-        gl.glEnd()
+        self._fade_quad_rgba[3::4] = int(self._clamp01(fade_amount) * 255)
+        _draw_vertex_array(gl.GL_TRIANGLE_FAN, self._fade_quad_xy, self._fade_quad_rgba)
 
     # ------------------------------------------------------------------
     # Utilities
@@ -1581,46 +2402,22 @@ class OpeningSceneCutscene:
         return self._clamp01(rise * decay)
 
     def _scene2_current_speaker(self, tv_time: float) -> Tuple[int, float]:
+        # Branchless form: clamping the time and the switch index covers the
+        # "past the final switch" case without the original if/else.
         interval = self.SCENE2_SWITCH_INTERVAL
-        max_switch_time = self.SCENE2_INTERVIEW_SWITCHES * interval
-        if tv_time >= max_switch_time:
-            switch_index = self.SCENE2_INTERVIEW_SWITCHES
-            time_in_segment = min(interval, tv_time - max_switch_time)
-        else:
-            switch_index = int(tv_time // interval)
-            time_in_segment = tv_time - switch_index * interval
-        switch_index = min(switch_index, self.SCENE2_INTERVIEW_SWITCHES)
-        talk_phase = time_in_segment / max(0.001, interval)
-        talk_phase = self._clamp01(talk_phase)
-        speaker_index = switch_index % 2
-        return speaker_index, talk_phase
-
-    def _generate_starfield(self, count: int) -> List[Star]:
-        stars: List[Star] = []
-        for _ in range(count):
-            stars.append(
-                Star(
-                    position=(random.random(), random.random()),
-                    base_brightness=random.uniform(0.2, 0.8),
-                    twinkle_speed=random.uniform(0.8, 1.5),
-                    phase=random.uniform(0.0, math.tau),
-                )
-            )
-        return stars
-
-    def _generate_trees(self, count: int) -> List[ForestTree]:
-        trees: List[ForestTree] = []
-        while len(trees) < count:
-            x = random.uniform(0.08, 0.92)
-            if abs(x - 0.5) < 0.18:
-                continue  # Leave a clearing around the house footprint.
-            trees.append(
-                ForestTree(
-                    position=(x, random.random()),
-                    height=random.uniform(0.85, 1.15),
-                )
-            )
-        return trees
+        inv_interval = self.SCENE2_INV_SWITCH_INTERVAL
+        clamped = min(tv_time, self.SCENE2_MAX_SWITCH_TIME + interval)
+        switch_index = min(
+            int(clamped * inv_interval), self.SCENE2_INTERVIEW_SWITCHES
+        )
+        talk_phase = self._clamp01((clamped - switch_index * interval) * inv_interval)
+        return switch_index & 1, talk_phase
+
+    def _generate_starfield(self, count: int) -> StarField:
+        return _starfield_for(count, (0.2, 0.8), (0.8, 1.5))
+
+    def _generate_trees(self, count: int) -> ForestLayout:
+        return _forest_trees_for(count)
 
     @staticmethod
     def _clamp01(value: float) -> float:
@@ -1634,7 +2431,16 @@ class OpeningSceneCutscene:
 
     # ------------------------------------------------------------------
     # 3D helpers
-    def _project_point(self, point: Vec3, camera: SceneCamera) -> Optional[Tuple[float, float, float]]:
+    def _projection_setup(
+        self, camera: SceneCamera
+    ) -> Tuple[Vec3, Vec3, Vec3, Vec3, float, float, float, float]:
+        """Gather the per-frame invariant pieces of the projection.
+
+        The camera basis, focal factor, and viewport scale are the same for
+        every vertex projected in a frame, so batch renderers compute them
+        once here rather than inside the per-vertex path.
+        """
+
         width, height = self._viewport_size
         aspect = width / max(1.0, float(height))
         forward = self._normalized3(
@@ -1649,37 +2455,51 @@ class OpeningSceneCutscene:
             up_hint = (0.0, 0.0, 1.0)
         right = self._normalized3(self._cross3(forward, up_hint))
         up = self._cross3(right, forward)
-        relative = (
-            point[0] - camera.position[0],
-            point[1] - camera.position[1],
-            point[2] - camera.position[2],
-        )
-        view_x = self._dot3(relative, right)
-        view_y = self._dot3(relative, up)
-        view_z = self._dot3(relative, forward)
-        near = 0.1
-        if view_z <= near:
-            return None
         f = 1.0 / math.tan(max(0.1, camera.fov * 0.5))
+        return camera.position, right, up, forward, f, aspect, float(width), float(height)
+
+    @staticmethod
+    def _project_with_setup(
+        point: Vec3,
+        setup: Tuple[Vec3, Vec3, Vec3, Vec3, float, float, float, float],
+    ) -> Optional[Tuple[float, float, float]]:
+        position, right, up, forward, f, aspect, width, height = setup
+        rx = point[0] - position[0]
+        ry = point[1] - position[1]
+        rz = point[2] - position[2]
+        view_z = rx * forward[0] + ry * forward[1] + rz * forward[2]
+        if view_z <= 0.1:
+            return None
+        view_x = rx * right[0] + ry * right[1] + rz * right[2]
+        view_y = rx * up[0] + ry * up[1] + rz * up[2]
         ndc_x = (view_x * f) / (view_z * aspect)
         ndc_y = (view_y * f) / view_z
         screen_x = width * (0.5 + ndc_x * 0.5)
         screen_y = height * (0.5 - ndc_y * 0.5)
         return screen_x, screen_y, view_z
 
+    def _project_point(self, point: Vec3, camera: SceneCamera) -> Optional[Tuple[float, float, float]]:
+        return self._project_with_setup(point, self._projection_setup(camera))
+
     def _render_face_batch(
         self,
         faces: Sequence[Tuple[Sequence[Vec3], Tuple[float, float, float], float, Tuple[float, float, float, float]]],
         camera: SceneCamera,
         light_dir: Vec3,
     ) -> None:
+        # The camera basis is fixed for the whole batch, and the helpers are
+        # hoisted to locals so the per-vertex loop avoids repeated attribute
+        # lookups.
+        setup = self._projection_setup(camera)
+        project = self._project_with_setup
+        face_normal = self._face_normal
         queue: List[Tuple[float, List[Vec2], Vec3, Tuple[float, float, float], float, Tuple[float, float, float, float]]] = []
         for vertices, base_color, alpha, wire_color in faces:
             projected: List[Vec2] = []
             depths: List[float] = []
             skip = False
             for vertex in vertices:
-                result = self._project_point(vertex, camera)
+                result = project(vertex, setup)
                 if result is None:
                     skip = True
                     break
@@ -1687,33 +2507,35 @@ class OpeningSceneCutscene:
                 depths.append(result[2])
             if skip:
                 continue
-            normal = self._face_normal(vertices)
+            normal = face_normal(vertices)
             queue.append((sum(depths) / len(depths), projected, normal, base_color, alpha, wire_color))
 
         queue.sort(key=lambda entry: entry[0], reverse=True)
+        batch = self._batch
+        dot3 = self._dot3
+        add_polygon = batch.add_polygon
+        add_line_loop = batch.add_line_loop
         for _, projected, normal, base_color, alpha, wire_color in queue:
-            intensity = max(0.2, self._dot3(normal, light_dir) * 0.6 + 0.4)
-            color = (
-                self._clamp01(base_color[0] * intensity),
-                self._clamp01(base_color[1] * intensity),
-                self._clamp01(base_color[2] * intensity),
+            intensity = max(0.2, dot3(normal, light_dir) * 0.6 + 0.4)
+            add_polygon(
+                projected,
+                _rgba8(
+                    base_color[0] * intensity,
+                    base_color[1] * intensity,
+                    base_color[2] * intensity,
+                    alpha,
+                ),
             )
-            gl.glColor4f(color[0], color[1], color[2], alpha)
-            gl.glBegin(gl.GL_TRIANGLE_FAN)
-            for x, y in projected:
-                gl.glVertex2f(x, y)
-            gl.glEnd()
-
-            gl.glColor4f(
-                wire_color[0],
-                wire_color[1],
-                wire_color[2],
-                wire_color[3] * alpha,
+            add_line_loop(
+                projected,
+                _rgba8(
+                    wire_color[0],
+                    wire_color[1],
+                    wire_color[2],
+                    wire_color[3] * alpha,
+                ),
             )
-            gl.glBegin(gl.GL_LINE_LOOP)
-            for x, y in projected:
-                gl.glVertex2f(x, y)
-            gl.glEnd()
+        batch.flush()
 
     def _append_prism_faces(
         self,
@@ -1804,11 +2626,11 @@ class OpeningSceneCutscene:
         end_proj = self._project_point(end, camera)
         if start_proj is None or end_proj is None:
             return
-        gl.glColor4f(*color)
-        gl.glBegin(gl.GL_LINES)
-        gl.glVertex2f(start_proj[0], start_proj[1])
-        gl.glVertex2f(end_proj[0], end_proj[1])
-        gl.glEnd()
+        _draw_vertex_array(
+            gl.GL_LINES,
+            (start_proj[0], start_proj[1], end_proj[0], end_proj[1]),
+            _rgba8(*color) * 2,
+        )
 
     @staticmethod
     def _face_normal(vertices: Sequence[Vec3]) -> Vec3:
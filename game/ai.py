@@ -47,6 +47,12 @@ class EnemyAIController:
         # incursions from deep space.
         self._staging_center = (-half_w * 0.8, half_h * 0.65)
         self._staging_ring_step = 140.0
+        # Unit offsets for the eight staging slots, so spawning indexes a
+        # table instead of calling cos/sin per reinforcement.
+        self._slot_offsets = tuple(
+            (math.cos((slot / 8.0) * math.tau), math.sin((slot / 8.0) * math.tau))
+            for slot in range(8)
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -86,17 +92,15 @@ class EnemyAIController:
         base = self._world.player_primary_base()
         if base is not None:
             ship.set_move_target(base.position, behavior="attack")
-        self._world.ships.append(ship)
+        self._world.add_ship(ship)
 
     def _enemy_ships(self) -> List[Ship]:
-        return [ship for ship in self._world.ships if ship.faction == "enemy"]
+        return self._world.ships_for_faction("enemy")
 
     def _spawn_point(self, serial: int) -> "Vec2":
-        ring_index = serial // 8
-        slot = serial % 8
-        radius = 200.0 + self._staging_ring_step * ring_index
-        angle = (slot / 8.0) * (2.0 * math.pi)
-        offset_x = math.cos(angle) * radius
-        offset_y = math.sin(angle) * radius
+        # Eight slots per ring, so the slot and ring fall out of the low
+        # three bits.
+        radius = 200.0 + self._staging_ring_step * (serial >> 3)
+        unit_x, unit_y = self._slot_offsets[serial & 7]
         center_x, center_y = self._staging_center
-        return (center_x + offset_x, center_y + offset_y)
+        return (center_x + unit_x * radius, center_y + unit_y * radius)
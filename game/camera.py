@@ -4,7 +4,7 @@ from __future__ import annotations
 """3D camera utilities for Cosmogenesis."""
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Tuple
 
 import numpy as np
@@ -13,41 +13,11 @@ Vec2 = Tuple[float, float]
 Vec3 = Tuple[float, float, float]
 
 
-def _normalize(vec: np.ndarray) -> np.ndarray:
-    norm = np.linalg.norm(vec)
+def _normalize3(x: float, y: float, z: float) -> Vec3:
+    norm = math.sqrt(x * x + y * y + z * z)
     if norm == 0:
-        return vec
-    return vec / norm
-
-
-def _look_at_matrix(position: Vec3, target: Vec3, up: Vec3) -> np.ndarray:
-    pos = np.array(position, dtype=np.float32)
-    tgt = np.array(target, dtype=np.float32)
-    up_vec = np.array(up, dtype=np.float32)
-
-    forward = _normalize(tgt - pos)
-    side = _normalize(np.cross(forward, up_vec))
-    true_up = np.cross(side, forward)
-
-    view = np.identity(4, dtype=np.float32)
-    view[0, :3] = side
-    view[1, :3] = true_up
-    view[2, :3] = -forward
-    view[0, 3] = -np.dot(side, pos)
-    view[1, 3] = -np.dot(true_up, pos)
-    view[2, 3] = np.dot(forward, pos)
-    return view
-
-
-def _perspective_matrix(fov_degrees: float, aspect: float, near: float, far: float) -> np.ndarray:
-    perspective = np.zeros((4, 4), dtype=np.float32)
-    f = 1.0 / math.tan(math.radians(fov_degrees) / 2.0)
-    perspective[0, 0] = f / aspect
-    perspective[1, 1] = f
-    perspective[2, 2] = (far + near) / (near - far)
-    perspective[2, 3] = (2 * far * near) / (near - far)
-    perspective[3, 2] = -1.0
-    return perspective
+        return (x, y, z)
+    return (x / norm, y / norm, z / norm)
 
 
 @dataclass
@@ -63,21 +33,46 @@ class Camera3D:
     near_clip: float = 1.0
     far_clip: float = 5000.0
     up: Vec3 = (0.0, 1.0, 0.0)
+    # Cached view-projection, keyed on the inputs that feed it. The matrix
+    # is rebuilt only when the camera actually changed, so the per-frame
+    # world_to_screen/screen_to_world calls stop re-deriving it each time.
+    _vp_cache: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vp_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _inv_vp_cache: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _inv_vp_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _proj_cache: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _proj_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vp_flat: Optional[Tuple[float, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def move(self, direction: Vec2, dt: float) -> None:
         dx, dz = direction
         if dx == 0 and dz == 0:
             return
-        movement = (dx * self.speed * dt, 0.0, dz * self.speed * dt)
+        move_x = dx * self.speed * dt
+        move_z = dz * self.speed * dt
         self.position = (
-            self.position[0] + movement[0],
-            self.position[1] + movement[1],
-            self.position[2] + movement[2],
+            self.position[0] + move_x,
+            self.position[1],
+            self.position[2] + move_z,
         )
         self.target = (
-            self.target[0] + movement[0],
-            self.target[1] + movement[1],
-            self.target[2] + movement[2],
+            self.target[0] + move_x,
+            self.target[1],
+            self.target[2] + move_z,
         )
 
     def recenter_on(self, world_pos: Vec2) -> None:
@@ -99,54 +94,223 @@ class Camera3D:
     def zoom(self, scroll_delta: float) -> None:
         """Move the camera closer/farther from the target while preserving angle."""
 
-        view_dir = self._view_direction()
-        if np.linalg.norm(view_dir) == 0:
+        dx = self.position[0] - self.target[0]
+        dy = self.position[1] - self.target[1]
+        dz = self.position[2] - self.target[2]
+        current_distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if current_distance == 0:
             return
-        current_distance = np.linalg.norm(np.array(self.position) - np.array(self.target))
         desired = current_distance - scroll_delta * self.zoom_speed
         clamped = max(self.min_zoom, min(self.max_zoom, desired))
+        scale = clamped / current_distance
         self.position = (
-            self.target[0] + view_dir[0] * clamped,
-            self.target[1] + view_dir[1] * clamped,
-            self.target[2] + view_dir[2] * clamped,
+            self.target[0] + dx * scale,
+            self.target[1] + dy * scale,
+            self.target[2] + dz * scale,
         )
 
     def update_viewport(self, size: Tuple[int, int]) -> None:
         self.viewport_size = size
 
     def view_matrix(self) -> np.ndarray:
-        return _look_at_matrix(self.position, self.target, self.up)
+        # Plain scalar math for the 3-vector work: math.sqrt on three floats
+        # is far cheaper than routing tiny arrays through numpy.
+        px, py, pz = self.position
+        fx, fy, fz = _normalize3(
+            self.target[0] - px, self.target[1] - py, self.target[2] - pz
+        )
+        if self.up == (0.0, 1.0, 0.0):
+            # With the default world-up the side cross product collapses to
+            # a horizontal vector, saving the general formula.
+            sx, sy, sz = _normalize3(-fz, 0.0, fx)
+        else:
+            ux, uy, uz = self.up
+            sx, sy, sz = _normalize3(
+                fy * uz - fz * uy,
+                fz * ux - fx * uz,
+                fx * uy - fy * ux,
+            )
+        tx = sy * fz - sz * fy
+        ty = sz * fx - sx * fz
+        tz = sx * fy - sy * fx
+
+        view = np.identity(4, dtype=np.float32)
+        view[0, 0] = sx
+        view[0, 1] = sy
+        view[0, 2] = sz
+        view[1, 0] = tx
+        view[1, 1] = ty
+        view[1, 2] = tz
+        view[2, 0] = -fx
+        view[2, 1] = -fy
+        view[2, 2] = -fz
+        view[0, 3] = -(sx * px + sy * py + sz * pz)
+        view[1, 3] = -(tx * px + ty * py + tz * pz)
+        view[2, 3] = fx * px + fy * py + fz * pz
+        return view
 
     def projection_matrix(self) -> np.ndarray:
-        width, height = self.viewport_size
-        aspect = width / height if height > 0 else 1.0
-        return _perspective_matrix(self.fov, aspect, self.near_clip, self.far_clip)
+        # The perspective constants only change on viewport resizes or
+        # fov/clip tweaks, so the tan/divide work is cached behind the
+        # same value-keyed scheme as the view-projection below.
+        key = (self.viewport_size, self.fov, self.near_clip, self.far_clip)
+        if self._proj_cache is None or key != self._proj_key:
+            width, height = self.viewport_size
+            aspect = width / height if height > 0 else 1.0
+            f = 1.0 / math.tan(math.radians(self.fov) / 2.0)
+            near = self.near_clip
+            far = self.far_clip
+            perspective = np.zeros((4, 4), dtype=np.float32)
+            perspective[0, 0] = f / aspect
+            perspective[1, 1] = f
+            perspective[2, 2] = (far + near) / (near - far)
+            perspective[2, 3] = (2 * far * near) / (near - far)
+            perspective[3, 2] = -1.0
+            self._proj_cache = perspective
+            self._proj_key = key
+        return self._proj_cache
+
+    def _cache_key(self) -> tuple:
+        return (
+            self.position,
+            self.target,
+            self.viewport_size,
+            self.fov,
+            self.near_clip,
+            self.far_clip,
+            self.up,
+        )
 
     def view_projection_matrix(self) -> np.ndarray:
-        return self.projection_matrix() @ self.view_matrix()
+        # Keying the cache on the actual inputs (rather than dirty flags in
+        # every mutator) keeps it correct even if a caller assigns the public
+        # dataclass fields directly.
+        key = self._cache_key()
+        if self._vp_cache is None or key != self._vp_key:
+            self._vp_cache = self.projection_matrix() @ self.view_matrix()
+            # Flat Python-float copy for the scalar projection path: tuple
+            # indexing avoids sixteen ndarray element reads per call.
+            self._vp_flat = tuple(float(v) for v in self._vp_cache.ravel())
+            self._vp_key = key
+        return self._vp_cache
+
+    def _inverse_view_projection(self) -> np.ndarray:
+        """Return the cached inverse view-projection matrix.
+
+        Both factors have closed-form inverses — the view is an orthonormal
+        rotation plus translation and the perspective has five non-zero
+        entries — so no general 4x4 inversion is needed.
+        """
 
-    def _view_direction(self) -> np.ndarray:
-        pos = np.array(self.position, dtype=np.float32)
-        tgt = np.array(self.target, dtype=np.float32)
-        return _normalize(pos - tgt)
+        key = self._cache_key()
+        if self._inv_vp_cache is None or key != self._inv_vp_key:
+            view = self.view_matrix()
+            inv_view = np.identity(4, dtype=np.float32)
+            rotation_t = view[:3, :3].T
+            inv_view[:3, :3] = rotation_t
+            inv_view[:3, 3] = -rotation_t @ view[:3, 3]
+
+            proj = self.projection_matrix()
+            inv_proj = np.zeros((4, 4), dtype=np.float32)
+            inv_proj[0, 0] = 1.0 / proj[0, 0]
+            inv_proj[1, 1] = 1.0 / proj[1, 1]
+            inv_proj[2, 3] = -1.0
+            inv_proj[3, 2] = 1.0 / proj[2, 3]
+            inv_proj[3, 3] = proj[2, 2] / proj[2, 3]
+
+            self._inv_vp_cache = inv_view @ inv_proj
+            self._inv_vp_key = key
+        return self._inv_vp_cache
 
     def world_to_screen(self, world_pos: Vec2, elevation: float = 0.0) -> Optional[Vec2]:
         """Project a point on the world plane (y=elevation) to screen coordinates."""
 
         x, z = world_pos
-        point = np.array([x, elevation, z, 1.0], dtype=np.float32)
-        clip = self.view_projection_matrix() @ point
-        w = clip[3]
+        self.view_projection_matrix()
+        # Four scalar dot products against the cached flat copy beat building
+        # a vec4 and running a 4x4 matmul for every projected point; the
+        # tuple of Python floats keeps even element access off numpy.
+        m = self._vp_flat
+        w = m[12] * x + m[13] * elevation + m[14] * z + m[15]
         if w == 0:
             return None
-        ndc = clip[:3] / w
-        if ndc[2] < -1 or ndc[2] > 1:
+        ndc_z = (m[8] * x + m[9] * elevation + m[10] * z + m[11]) / w
+        if ndc_z < -1 or ndc_z > 1:
             return None
+        ndc_x = (m[0] * x + m[1] * elevation + m[2] * z + m[3]) / w
+        ndc_y = (m[4] * x + m[5] * elevation + m[6] * z + m[7]) / w
         width, height = self.viewport_size
-        screen_x = float((ndc[0] + 1.0) * 0.5 * width)
-        screen_y = float((1.0 - ndc[1]) * 0.5 * height)
+        screen_x = (ndc_x + 1.0) * 0.5 * width
+        screen_y = (1.0 - ndc_y) * 0.5 * height
         return (screen_x, screen_y)
 
+    def world_to_screen_batch(
+        self, points: np.ndarray, elevation: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Project ``(N, 2)`` world-plane points in a single matmul.
+
+        Returns ``(screen, valid)`` where ``screen`` is an ``(N, 2)`` float32
+        array of pixel coordinates and ``valid`` flags the rows that pass the
+        same w/depth checks ``world_to_screen`` applies. Callers looping over
+        whole fleets should prefer this over N scalar calls.
+        """
+
+        pts = np.asarray(points, dtype=np.float32)
+        count = len(pts)
+        homogeneous = np.empty((count, 4), dtype=np.float32)
+        homogeneous[:, 0] = pts[:, 0]
+        homogeneous[:, 1] = elevation
+        homogeneous[:, 2] = pts[:, 1]
+        homogeneous[:, 3] = 1.0
+        clip = homogeneous @ self.view_projection_matrix().T
+        w = clip[:, 3]
+        valid = w != 0
+        ndc = clip[:, :3] / np.where(valid, w, 1.0)[:, None]
+        valid &= (ndc[:, 2] >= -1.0) & (ndc[:, 2] <= 1.0)
+        width, height = self.viewport_size
+        screen = np.empty((count, 2), dtype=np.float32)
+        screen[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * width
+        screen[:, 1] = (1.0 - ndc[:, 1]) * 0.5 * height
+        return screen, valid
+
+    def screen_to_world_batch(
+        self, screen_points: np.ndarray, plane_height: float = 0.0
+    ) -> np.ndarray:
+        """Unproject ``(N, 2)`` screen points onto the world plane at once.
+
+        Vectorized counterpart of ``screen_to_world`` with the same
+        degenerate-ray fallbacks, for callers unprojecting many points per
+        frame (selection rectangles, viewport corners).
+        """
+
+        width, height = self.viewport_size
+        pts = np.asarray(screen_points, dtype=np.float32)
+        count = len(pts)
+        if width == 0 or height == 0:
+            return np.zeros((count, 2), dtype=np.float32)
+        inv_vp = self._inverse_view_projection()
+        rays = np.empty((count, 4), dtype=np.float32)
+        rays[:, 0] = (2.0 * pts[:, 0] / width) - 1.0
+        rays[:, 1] = 1.0 - (2.0 * pts[:, 1] / height)
+        rays[:, 3] = 1.0
+        rays[:, 2] = -1.0
+        near_world = rays @ inv_vp.T
+        rays[:, 2] = 1.0
+        far_world = rays @ inv_vp.T
+        near_w = near_world[:, 3]
+        far_w = far_world[:, 3]
+        near_world /= np.where(near_w != 0, near_w, 1.0)[:, None]
+        far_world /= np.where(far_w != 0, far_w, 1.0)[:, None]
+        direction = far_world - near_world
+        dy = direction[:, 1]
+        parallel = np.abs(dy) < 1e-5
+        t = (plane_height - near_world[:, 1]) / np.where(parallel, 1.0, dy)
+        hits = near_world + direction * t[:, None]
+        result = np.empty((count, 2), dtype=np.float32)
+        result[:, 0] = np.where(parallel, near_world[:, 0], hits[:, 0])
+        result[:, 1] = np.where(parallel, near_world[:, 2], hits[:, 2])
+        return result
+
     def screen_to_world(self, screen_pos: Vec2, plane_height: float = 0.0) -> Vec2:
         """Intersect a ray from the camera through ``screen_pos`` with the world plane."""
 
@@ -155,7 +319,7 @@ class Camera3D:
             return (0.0, 0.0)
         x = (2.0 * screen_pos[0] / width) - 1.0
         y = 1.0 - (2.0 * screen_pos[1] / height)
-        inv_vp = np.linalg.inv(self.view_projection_matrix())
+        inv_vp = self._inverse_view_projection()
         near_point = np.array([x, y, -1.0, 1.0], dtype=np.float32)
         far_point = np.array([x, y, 1.0, 1.0], dtype=np.float32)
 
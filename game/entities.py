@@ -16,6 +16,15 @@ CombatTarget = Union["Ship", "Facility", "Base"]
 PASSIVE_REPAIR_DELAY = 5.0
 PASSIVE_REPAIR_RATE = 0.005
 
+# Approximate render scale per ship class (matches the draw system).
+_MODEL_SCALE = {
+    "Strike": 0.7,
+    "Escort": 1.0,
+    "Line": 1.3,
+    "Capital": 1.6,
+    "Utility": 0.6,
+}
+
 
 def _passive_repair_per_second(max_value: float) -> float:
     if max_value <= 0.0:
@@ -23,14 +32,14 @@ def _passive_repair_per_second(max_value: float) -> float:
     return float(math.ceil(PASSIVE_REPAIR_RATE * max_value))
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     position: Vec2
     rotation: float = field(default=0.0, kw_only=True)
     scale: float = field(default=1.0, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class Planetoid(Entity):
     radius: float = 80.0
     resource_yield: int = 100
@@ -49,7 +58,7 @@ class Planetoid(Entity):
         self.controller = faction
 
 
-@dataclass
+@dataclass(slots=True)
 class Asteroid(Entity):
     """Smaller resource nodes that supplement planetoid income."""
 
@@ -64,7 +73,7 @@ class Asteroid(Entity):
         self.controller = faction
 
 
-@dataclass
+@dataclass(slots=True)
 class Base(Entity):
     name: str = "Astral Citadel"
     resource_cost: str = "N/A"
@@ -96,6 +105,7 @@ class Base(Entity):
     firing_range_value: float = field(init=False)
     weapon_damage_value: float = field(init=False)
     _time_since_damage: float = field(default=PASSIVE_REPAIR_DELAY, init=False, repr=False)
+    _passive_repair_rate: float = field(default=0.0, init=False, repr=False)
 
     # TODO: Attach upgrade modules and research integration when systems are implemented.
 
@@ -113,6 +123,7 @@ class Base(Entity):
         self.firing_range_value = float(self.firing_range)
         self.weapon_damage_value = float(self.weapon_damage)
         self._time_since_damage = PASSIVE_REPAIR_DELAY
+        self._passive_repair_rate = _passive_repair_per_second(self.max_shields)
 
     def queue_ship(self, ship_name: str) -> ProductionJob:
         """Convenience helper so higher-level systems can add ship orders."""
@@ -127,35 +138,35 @@ class Base(Entity):
     def apply_stat_multipliers(self, multipliers: Mapping[str, float]) -> None:
         """Apply research-driven stat changes to this base."""
 
-        def mult(attribute: str) -> float:
-            return float(multipliers.get(attribute, 1.0))
+        get = multipliers.get
 
         prev_max_health = self.max_health
-        new_max_health = float(self.health) * mult("health")
+        new_max_health = float(self.health) * float(get("health", 1.0))
         self.max_health = new_max_health
         self.current_health = Ship._scale_current_value(  # reuse helper semantics
             self.current_health, prev_max_health, new_max_health
         )
 
         prev_max_shields = self.max_shields
-        new_max_shields = float(self.shields) * mult("shields")
+        new_max_shields = float(self.shields) * float(get("shields", 1.0))
         self.max_shields = new_max_shields
+        self._passive_repair_rate = _passive_repair_per_second(new_max_shields)
         self.current_shields = Ship._scale_current_value(
             self.current_shields, prev_max_shields, new_max_shields
         )
 
-        self.armor_value = float(self.armor) * mult("armor")
-        self.weapon_damage_value = float(self.weapon_damage) * mult("weapon_damage")
-        self.firing_range_value = float(self.firing_range) * mult("firing_range")
-        self.visual_range_value = float(self.visual_range) * mult("visual_range")
-        self.radar_range_value = float(self.radar_range) * mult("radar_range")
+        self.armor_value = float(self.armor) * float(get("armor", 1.0))
+        self.weapon_damage_value = float(self.weapon_damage) * float(get("weapon_damage", 1.0))
+        self.firing_range_value = float(self.firing_range) * float(get("firing_range", 1.0))
+        self.visual_range_value = float(self.visual_range) * float(get("visual_range", 1.0))
+        self.radar_range_value = float(self.radar_range) * float(get("radar_range", 1.0))
         prev_max_energy = self.max_energy
-        new_max_energy = float(self.energy) * mult("energy")
+        new_max_energy = float(self.energy) * float(get("energy", 1.0))
         self.max_energy = new_max_energy
         self.current_energy = Ship._scale_current_value(
             self.current_energy, prev_max_energy, new_max_energy
         )
-        self.energy_regen_value = float(self.energy_regen) * mult("energy_regen")
+        self.energy_regen_value = float(self.energy_regen) * float(get("energy_regen", 1.0))
 
     def repair_full(self) -> None:
         self.current_health = self.max_health
@@ -170,7 +181,9 @@ class Base(Entity):
             return
         if self._time_since_damage < PASSIVE_REPAIR_DELAY:
             return
-        repair_rate = _passive_repair_per_second(self.max_shields)
+        # The rate only depends on max_shields, so it is cached whenever
+        # that changes instead of re-derived every tick.
+        repair_rate = self._passive_repair_rate
         if repair_rate <= 0.0:
             return
         self.current_shields = min(
@@ -183,12 +196,10 @@ class Base(Entity):
         if amount <= 0.0:
             return False
         self._time_since_damage = 0.0
-        if self.current_shields > 0.0:
-            shield_damage = min(amount, self.current_shields)
-            self.current_shields -= shield_damage
-            amount -= shield_damage
-        if amount > 0.0:
-            self.current_health -= amount
+        # min() handles the no-shields case, so the split needs no branches.
+        shield_damage = min(amount, self.current_shields)
+        self.current_shields -= shield_damage
+        self.current_health -= amount - shield_damage
         destroyed = self.current_health <= 0.0
         if destroyed:
             self.current_health = 0.0
@@ -196,7 +207,7 @@ class Base(Entity):
         return destroyed
 
 
-@dataclass
+@dataclass(slots=True)
 class Facility(Entity):
     """Represents a constructed facility that gates tech trees."""
 
@@ -209,6 +220,7 @@ class Facility(Entity):
     max_shields: float = field(init=False)
     armor_value: float = field(default=0.0, init=False)
     _time_since_damage: float = field(default=PASSIVE_REPAIR_DELAY, init=False, repr=False)
+    _passive_repair_rate: float = field(default=0.0, init=False, repr=False)
     weapon_damage_value: float = field(init=False)
     firing_range_value: float = field(init=False)
     _weapon_cooldown: float = field(default=0.0, init=False, repr=False)
@@ -221,6 +233,7 @@ class Facility(Entity):
         self.current_shields = self.max_shields
         # TODO: Populate armor/energy stats once guidance specifies them per facility.
         self._time_since_damage = PASSIVE_REPAIR_DELAY
+        self._passive_repair_rate = _passive_repair_per_second(self.max_shields)
         self.weapon_damage_value = float(getattr(self.definition, "weapon_damage", 0.0))
         self.firing_range_value = float(getattr(self.definition, "firing_range", 0.0))
         cooldown = float(getattr(self.definition, "weapon_cooldown", 1.0))
@@ -252,12 +265,10 @@ class Facility(Entity):
         if amount <= 0.0:
             return False
         self._time_since_damage = 0.0
-        if self.current_shields > 0.0:
-            shield_damage = min(amount, self.current_shields)
-            self.current_shields -= shield_damage
-            amount -= shield_damage
-        if amount > 0.0:
-            self.current_health -= amount
+        # min() handles the no-shields case, so the split needs no branches.
+        shield_damage = min(amount, self.current_shields)
+        self.current_shields -= shield_damage
+        self.current_health -= amount - shield_damage
         destroyed = self.current_health <= 0.0
         if destroyed:
             self.current_health = 0.0
@@ -277,7 +288,7 @@ class Facility(Entity):
             return
         if self._time_since_damage < PASSIVE_REPAIR_DELAY:
             return
-        repair_rate = _passive_repair_per_second(self.max_shields)
+        repair_rate = self._passive_repair_rate
         if repair_rate <= 0.0:
             return
         self.current_shields = min(
@@ -302,7 +313,7 @@ class Facility(Entity):
         return self.weapon_damage_value
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerAssignment:
     """Tracks autonomous worker behavior for civilian ships."""
 
@@ -314,7 +325,7 @@ class WorkerAssignment:
     cargo: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Ship(Entity):
     """Runtime instance of a ship hull from `ship_guidance`."""
 
@@ -344,31 +355,38 @@ class Ship(Entity):
     _visual_range: float = field(init=False)
     _radar_range: float = field(init=False)
     _firing_range: float = field(init=False)
+    _firing_range_sq: float = field(init=False, repr=False)
     worker_assignment: Optional[WorkerAssignment] = field(default=None, repr=False)
     collision_radius: float = field(init=False, repr=False)
     _turn_alignment_tolerance: float = field(default=3.0, init=False, repr=False)
     _attack_move_engaged: bool = field(default=False, init=False, repr=False)
     _time_since_damage: float = field(default=PASSIVE_REPAIR_DELAY, init=False, repr=False)
+    _passive_repair_rate: float = field(default=0.0, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.max_health = float(self.definition.health)
-        self.max_shields = float(self.definition.shields)
-        self.max_energy = float(self.definition.energy)
-        self.armor_value = float(self.definition.armor)
-        self.energy_regen_value = float(self.definition.energy_regen)
-        self.flight_speed = float(self.definition.flight_speed)
-        self.acceleration = float(self.definition.acceleration)
-        self.turn_rate = float(self.definition.turn_rate)
-        self.weapon_damage_value = float(self.definition.weapon_damage)
-        self._visual_range = float(self.definition.visual_range)
-        self._radar_range = float(self.definition.radar_range)
-        self._firing_range = float(self.definition.firing_range)
+        # One attribute chase for the shared definition; the reads below
+        # all hit the local.
+        definition = self.definition
+        self.max_health = float(definition.health)
+        self.max_shields = float(definition.shields)
+        self.max_energy = float(definition.energy)
+        self.armor_value = float(definition.armor)
+        self.energy_regen_value = float(definition.energy_regen)
+        self.flight_speed = float(definition.flight_speed)
+        self.acceleration = float(definition.acceleration)
+        self.turn_rate = float(definition.turn_rate)
+        self.weapon_damage_value = float(definition.weapon_damage)
+        self._visual_range = float(definition.visual_range)
+        self._radar_range = float(definition.radar_range)
+        self._firing_range = float(definition.firing_range)
+        self._firing_range_sq = self._firing_range * self._firing_range
         self.current_health = self.max_health
         self.current_shields = self.max_shields
         self.current_energy = self.max_energy
         self.rotation = self._wrap_angle(self.rotation)
-        self.collision_radius = 0.5 * self._model_scale_for(self.definition.ship_class)
+        self.collision_radius = 0.5 * self._model_scale_for(definition.ship_class)
         self._time_since_damage = PASSIVE_REPAIR_DELAY
+        self._passive_repair_rate = _passive_repair_per_second(self.max_shields)
 
     @property
     def name(self) -> str:
@@ -418,7 +436,7 @@ class Ship(Entity):
     def in_firing_range(self, other: Entity) -> bool:
         dx = other.position[0] - self.position[0]
         dy = other.position[1] - self.position[1]
-        return dx * dx + dy * dy <= self.firing_range * self.firing_range
+        return dx * dx + dy * dy <= self._firing_range_sq
 
     def has_manual_target(self) -> bool:
         return self._manual_target
@@ -436,7 +454,7 @@ class Ship(Entity):
     ) -> None:
         """Pick the closest valid enemy in range from ships/facilities/bases."""
 
-        range_sq = self.firing_range * self.firing_range
+        range_sq = self._firing_range_sq
         best_target: Optional[CombatTarget] = None
         best_distance_sq = float("inf")
 
@@ -490,7 +508,10 @@ class Ship(Entity):
             return
 
         if self.move_target is None:
-            self._decelerate(dt)
+            # Most of the fleet is stationary most frames; skip the method
+            # call entirely once a ship has coasted to a stop.
+            if self.current_speed > 0.0:
+                self._decelerate(dt)
             return
 
         if self.move_behavior == "attack" and self._attack_move_engaged:
@@ -499,8 +520,10 @@ class Ship(Entity):
 
         dx = self.move_target[0] - self.position[0]
         dy = self.move_target[1] - self.position[1]
-        distance = math.hypot(dx, dy)
-        if distance <= self.arrival_threshold:
+        # Work in squared distance; both checks below are threshold
+        # comparisons, so the per-tick sqrt is never needed.
+        distance_sq = dx * dx + dy * dy
+        if distance_sq <= self.arrival_threshold * self.arrival_threshold:
             self.position = self.move_target
             self.move_target = None
             self.current_speed = 0.0
@@ -523,7 +546,7 @@ class Ship(Entity):
         if travel_distance <= 0.0:
             return
 
-        if distance <= travel_distance:
+        if distance_sq <= travel_distance * travel_distance:
             self.position = self.move_target
             self.move_target = None
             self.current_speed = 0.0
@@ -549,7 +572,7 @@ class Ship(Entity):
             return
         if self._time_since_damage < PASSIVE_REPAIR_DELAY:
             return
-        repair_rate = _passive_repair_per_second(self.max_shields)
+        repair_rate = self._passive_repair_rate
         if repair_rate <= 0.0:
             return
         self.current_shields = min(
@@ -573,54 +596,53 @@ class Ship(Entity):
             return False
         self._time_since_damage = 0.0
 
-        if self.current_shields > 0.0:
-            shield_damage = min(amount, self.current_shields)
-            self.current_shields -= shield_damage
-            amount -= shield_damage
-
-        if amount > 0.0:
-            self.current_health -= amount
+        # min() handles the no-shields case, so the split needs no branches.
+        shield_damage = min(amount, self.current_shields)
+        self.current_shields -= shield_damage
+        self.current_health -= amount - shield_damage
 
         return self.current_health <= 0.0
 
     def apply_stat_multipliers(self, multipliers: Mapping[str, float]) -> None:
         """Apply cumulative research modifiers provided by ``multipliers``."""
 
-        def mult(attribute: str) -> float:
-            return float(multipliers.get(attribute, 1.0))
+        get = multipliers.get
+        definition = self.definition
 
         prev_max_health = self.max_health
-        new_max_health = float(self.definition.health) * mult("health")
+        new_max_health = float(definition.health) * float(get("health", 1.0))
         self.max_health = new_max_health
         self.current_health = self._scale_current_value(
             self.current_health, prev_max_health, new_max_health
         )
 
         prev_max_shields = self.max_shields
-        new_max_shields = float(self.definition.shields) * mult("shields")
+        new_max_shields = float(definition.shields) * float(get("shields", 1.0))
         self.max_shields = new_max_shields
+        self._passive_repair_rate = _passive_repair_per_second(new_max_shields)
         self.current_shields = self._scale_current_value(
             self.current_shields, prev_max_shields, new_max_shields
         )
 
         prev_max_energy = self.max_energy
-        new_max_energy = float(self.definition.energy) * mult("energy")
+        new_max_energy = float(definition.energy) * float(get("energy", 1.0))
         self.max_energy = new_max_energy
         self.current_energy = self._scale_current_value(
             self.current_energy, prev_max_energy, new_max_energy
         )
 
-        self.armor_value = float(self.definition.armor) * mult("armor")
-        self.energy_regen_value = float(self.definition.energy_regen) * mult("energy_regen")
-        self.flight_speed = float(self.definition.flight_speed) * mult("flight_speed")
-        self.acceleration = float(self.definition.acceleration) * mult("acceleration")
-        self.turn_rate = float(self.definition.turn_rate) * mult("turn_rate")
+        self.armor_value = float(definition.armor) * float(get("armor", 1.0))
+        self.energy_regen_value = float(definition.energy_regen) * float(get("energy_regen", 1.0))
+        self.flight_speed = float(definition.flight_speed) * float(get("flight_speed", 1.0))
+        self.acceleration = float(definition.acceleration) * float(get("acceleration", 1.0))
+        self.turn_rate = float(definition.turn_rate) * float(get("turn_rate", 1.0))
         self.weapon_damage_value = (
-            float(self.definition.weapon_damage) * mult("weapon_damage")
+            float(definition.weapon_damage) * float(get("weapon_damage", 1.0))
         )
-        self._visual_range = float(self.definition.visual_range) * mult("visual_range")
-        self._radar_range = float(self.definition.radar_range) * mult("radar_range")
-        self._firing_range = float(self.definition.firing_range) * mult("firing_range")
+        self._visual_range = float(definition.visual_range) * float(get("visual_range", 1.0))
+        self._radar_range = float(definition.radar_range) * float(get("radar_range", 1.0))
+        self._firing_range = float(definition.firing_range) * float(get("firing_range", 1.0))
+        self._firing_range_sq = self._firing_range * self._firing_range
         self.current_speed = min(self.current_speed, self.flight_speed)
 
     def _accelerate(self, dt: float) -> None:
@@ -649,26 +671,15 @@ class Ship(Entity):
 
     @staticmethod
     def _wrap_angle(angle: float) -> float:
-        wrapped = angle % 360.0
-        if wrapped < 0.0:
-            wrapped += 360.0
-        return wrapped
+        # Python's % takes the divisor's sign, so the result is already
+        # non-negative; no fix-up branch is needed.
+        return angle % 360.0
 
     @staticmethod
     def _model_scale_for(ship_class: str) -> float:
         """Approximate render scale for each ship class (matches draw system)."""
 
-        if ship_class == "Strike":
-            return 0.7
-        if ship_class == "Escort":
-            return 1.0
-        if ship_class == "Line":
-            return 1.3
-        if ship_class == "Capital":
-            return 1.6
-        if ship_class == "Utility":
-            return 0.6
-        return 1.0
+        return _MODEL_SCALE.get(ship_class, 1.0)
 
     @staticmethod
     def _normalize_angle(angle: float) -> float:
@@ -9,6 +9,10 @@ from .ship_registry import ShipDefinition, get_ship_definition
 
 MAX_SHIP_QUEUE = 10
 
+# Shared idle-case result: callers only iterate the completed list, so the
+# per-base per-tick update can skip allocating a fresh empty one.
+_NO_COMPLETED: List[ShipDefinition] = []
+
 
 @dataclass
 class ProductionJob:
@@ -74,6 +78,8 @@ class ProductionQueue:
     def update(self, dt: float) -> List[ShipDefinition]:
         """Advance timers and return any ship definitions that completed."""
 
+        if dt <= 0.0 or (self._active is None and not self._pending):
+            return _NO_COMPLETED
         completed: List[ShipDefinition] = []
         time_remaining = dt
         while time_remaining > 0.0:
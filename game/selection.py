@@ -235,15 +235,18 @@ def select_ships_in_camera_view(
         world.selected_facility = None
 
     definition_name = exemplar.definition.name
-    for ship in world.ships:
+    # One batched projection over the world's position columns replaces a
+    # scalar world_to_screen call per ship.
+    screen, valid = camera.world_to_screen_batch(world.ship_positions())
+    for index, ship in enumerate(world.ships):
         if ship.definition.name != definition_name:
             continue
         if not _is_selectable(world, ship):
             continue
-        screen_pos = camera.world_to_screen(ship.position)
-        if screen_pos is None:
+        if not valid[index]:
             continue
-        x, y = screen_pos
+        x = float(screen[index, 0])
+        y = float(screen[index, 1])
         if 0.0 <= x <= viewport_width and 0.0 <= y <= viewport_height:
             _add_to_selection(world, ship)
 
@@ -0,0 +1,56 @@
+"""Uniform spatial grid for proximity queries over the fleet."""
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+Vec2 = Tuple[float, float]
+
+
+class SpatialGrid:
+    """Buckets ship row indices by cell for O(1 + k) radius queries.
+
+    The grid is rebuilt from the world's contiguous position columns each
+    tick, so range checks (facility targeting, future aggro scans) walk only
+    the handful of cells a radius covers instead of every ship in the world.
+    """
+
+    def __init__(self, cell_size: float = 512.0) -> None:
+        self.cell_size = max(1.0, cell_size)
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    def rebuild(self, positions: np.ndarray) -> None:
+        """Re-bucket all rows of an ``(N, 2)`` position array."""
+
+        buckets = self._buckets
+        buckets.clear()
+        if len(positions) == 0:
+            return
+        cells = np.floor_divide(positions, self.cell_size).astype(np.int32)
+        for row, (cell_x, cell_y) in enumerate(cells.tolist()):
+            buckets.setdefault((cell_x, cell_y), []).append(row)
+
+    def query_radius(self, center: Vec2, radius: float) -> List[int]:
+        """Return the row indices of every bucket a radius could touch.
+
+        Candidates are a superset — callers still apply their exact distance
+        check — but only cells overlapping the query square are visited.
+        """
+
+        if radius <= 0.0 or not self._buckets:
+            return []
+        cell_size = self.cell_size
+        min_x = int(math.floor((center[0] - radius) / cell_size))
+        max_x = int(math.floor((center[0] + radius) / cell_size))
+        min_y = int(math.floor((center[1] - radius) / cell_size))
+        max_y = int(math.floor((center[1] + radius) / cell_size))
+        buckets = self._buckets
+        results: List[int] = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                rows = buckets.get((cell_x, cell_y))
+                if rows is not None:
+                    results.extend(rows)
+        return results
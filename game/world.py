@@ -5,6 +5,8 @@ import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from .ai import EnemyAIController
 from .entities import (
     Asteroid,
@@ -27,6 +29,7 @@ from .facility_registry import (
     get_facility_definition,
 )
 from .research import ResearchAvailability, ResearchManager, ResearchNode
+from .spatial import SpatialGrid
 from .visibility import VisibilityGrid
 
 Vec2 = Tuple[float, float]
@@ -96,6 +99,13 @@ class World:
     visibility: VisibilityGrid = field(init=False, repr=False)
     player_faction: str = "player"
     enemy_ai: EnemyAIController | None = field(default=None, init=False, repr=False)
+    ships_by_faction: Dict[str, List[Ship]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _ship_position_buffer: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False
+    )
+    ship_grid: SpatialGrid = field(default_factory=SpatialGrid, init=False, repr=False)
     beam_visuals: List[BeamVisual] = field(default_factory=list, repr=False)
     pending_construction: "PendingFacilityPlacement" | None = None
 
@@ -119,7 +129,11 @@ class World:
         for ship in self.ships:
             ship.update(dt)
             ship.tick_weapon_cooldown(dt)
-            ship.tick_passive_repair(dt)
+            # Entities at full shields skip the repair tick entirely: the
+            # damage timer is only consulted once shields drop below max,
+            # and apply_damage resets it, so the idle common case is free.
+            if ship.current_shields < ship.max_shields:
+                ship.tick_passive_repair(dt)
 
         self._resolve_ship_collisions(dt)
 
@@ -141,11 +155,13 @@ class World:
             completed = base.update(dt)
             for ship_definition in completed:
                 self._spawn_ship_from_base(base, ship_definition)
-            base.tick_passive_repair(dt)
+            if base.current_shields < base.max_shields:
+                base.tick_passive_repair(dt)
 
         self._update_facility_construction(dt)
         for facility in self.facilities:
-            facility.tick_passive_repair(dt)
+            if facility.current_shields < facility.max_shields:
+                facility.tick_passive_repair(dt)
             facility.tick_weapon_cooldown(dt)
         self._update_combat(dt)
         self._update_beam_visuals(dt)
@@ -239,6 +255,51 @@ class World:
         # TODO: Integrate contested capture/combat when mining units exist.
         return True
 
+    # ------------------------------------------------------------------
+    # Ship management
+    # ------------------------------------------------------------------
+    def add_ship(self, ship: Ship) -> None:
+        """Register ``ship`` and keep the per-faction partition in sync.
+
+        All fleet additions go through here so callers like the enemy AI can
+        read ``ships_for_faction`` without rescanning the whole fleet.
+        """
+
+        self.ships.append(ship)
+        self.ships_by_faction.setdefault(ship.faction, []).append(ship)
+
+    def remove_ship(self, ship: Ship) -> None:
+        if ship in self.ships:
+            self.ships.remove(ship)
+            faction_ships = self.ships_by_faction.get(ship.faction)
+            if faction_ships is not None and ship in faction_ships:
+                faction_ships.remove(ship)
+        if ship in self.selected_ships:
+            self.selected_ships.remove(ship)
+
+    def ships_for_faction(self, faction: str) -> List[Ship]:
+        """Return the live list of ships belonging to ``faction``."""
+
+        return self.ships_by_faction.get(faction, [])
+
+    def ship_positions(self) -> np.ndarray:
+        """Snapshot every ship's position into one contiguous (N, 2) array.
+
+        Row ``i`` corresponds to ``self.ships[i]``, so vectorized consumers
+        (batch camera projection, culling) can index results back to ships.
+        The backing buffer grows amortized and is reused between calls.
+        """
+
+        count = len(self.ships)
+        buffer = self._ship_position_buffer
+        if buffer is None or len(buffer) < count:
+            capacity = max(16, 2 * count)
+            buffer = np.empty((capacity, 2), dtype=np.float32)
+            self._ship_position_buffer = buffer
+        for row, ship in enumerate(self.ships):
+            buffer[row, 0], buffer[row, 1] = ship.position
+        return buffer[:count]
+
     # ------------------------------------------------------------------
     # Facility management (ties into research gating per `research_guidance`).
     # ------------------------------------------------------------------
@@ -377,7 +438,7 @@ class World:
         self._apply_ship_research(ship)
         if ship.is_worker:
             self._configure_worker(ship, base)
-        self.ships.append(ship)
+        self.add_ship(ship)
         if base.waypoint is not None and not ship.is_worker:
             ship.set_move_target(base.waypoint)
 
@@ -430,6 +491,9 @@ class World:
     def _update_combat(self, dt: float) -> None:
         """Resolve simplistic auto-attacks between hostile ships."""
 
+        # Positions are settled for this tick, so re-bucket the fleet once
+        # and let range queries walk only nearby cells.
+        self.ship_grid.rebuild(self.ship_positions())
         destroyed_ships: List[Ship] = []
         destroyed_facilities: List[Facility] = []
         destroyed_bases: List[Base] = []
@@ -443,16 +507,28 @@ class World:
                 ship.clear_target()
                 target = None
             if target is None:
-                ship.acquire_target(self.ships, self.facilities, self.bases)
+                ship.acquire_target(
+                    self._ships_near(ship.position, ship.firing_range),
+                    self.facilities,
+                    self.bases,
+                )
                 target = ship.target
             elif not ship.in_firing_range(target):
                 if ship.has_manual_target():
                     ship.set_move_target(target.position, behavior="attack")
                 else:
-                    ship.acquire_target(self.ships, self.facilities, self.bases)
+                    ship.acquire_target(
+                        self._ships_near(ship.position, ship.firing_range),
+                        self.facilities,
+                        self.bases,
+                    )
                     target = ship.target
             elif retarget_due:
-                ship.acquire_target(self.ships, self.facilities, self.bases)
+                ship.acquire_target(
+                    self._ships_near(ship.position, ship.firing_range),
+                    self.facilities,
+                    self.bases,
+                )
                 target = ship.target
             if target is None:
                 ship.hold_position_for_attack(False)
@@ -490,15 +566,23 @@ class World:
 
         if destroyed_ships:
             for ship in destroyed_ships:
-                if ship in self.ships:
-                    self.ships.remove(ship)
-                if ship in self.selected_ships:
-                    self.selected_ships.remove(ship)
+                self.remove_ship(ship)
         for facility in destroyed_facilities:
             self.remove_facility(facility)
         for base in destroyed_bases:
             self._handle_base_destroyed(base)
 
+    def _ships_near(self, position: Vec2, radius: float) -> List[Ship]:
+        """Return the ships in grid cells the given radius could reach.
+
+        A superset of the ships actually inside ``radius`` — callers keep
+        their exact distance checks — but target scans stay proportional to
+        local density instead of fleet size.
+        """
+
+        ships = self.ships
+        return [ships[row] for row in self.ship_grid.query_radius(position, radius)]
+
     def _facility_attack_target(self, facility: Facility) -> Optional[Ship]:
         if not facility.online:
             return None
@@ -508,7 +592,12 @@ class World:
         range_sq = facility.firing_range_value * facility.firing_range_value
         closest: Optional[Ship] = None
         closest_dist = range_sq
-        for ship in self.ships:
+        # The spatial grid narrows the scan to ships in cells the firing
+        # radius overlaps; the exact distance check below is unchanged.
+        for row in self.ship_grid.query_radius(
+            facility.position, facility.firing_range_value
+        ):
+            ship = self.ships[row]
             if ship.faction == owner:
                 continue
             distance_sq = self._distance_sq(ship.position, facility.position)
@@ -1016,7 +1105,7 @@ def create_initial_world() -> World:
         worker = Ship(position=spawn_pos, definition=worker_def)
         world._apply_ship_research(worker)
         world._configure_worker(worker, base, resource_target=planetoid)
-        world.ships.append(worker)
+        world.add_ship(worker)
 
     # Seed a handful of strike/escort ships for visualization tests.
     spearling = Ship(position=(400.0, 120.0), definition=get_ship_definition("Spearling"))
@@ -1024,7 +1113,7 @@ def create_initial_world() -> World:
     iron_halberd = Ship(position=(-280.0, 200.0), definition=get_ship_definition("Iron Halberd"))
     for ship in (spearling, warden, iron_halberd):
         world._apply_ship_research(ship)
-        world.ships.append(ship)
+        world.add_ship(ship)
 
     world.refresh_visibility()
 
@@ -671,16 +671,24 @@ class WireframeRenderer:
     def _draw_ship_status_bars(self, world: World, camera: Camera3D) -> None:
         grid = getattr(world, "visibility", None)
         viewport_rect = pygame.Rect(0, 0, *self._current_viewport_size)
+        candidates = []
         for ship in world.ships:
             if ship.faction != world.player_faction:
                 if grid is not None and not grid.is_visual(ship.position):
                     continue
             if ship.current_health >= ship.max_health and ship.current_shields >= ship.max_shields:
                 continue
-            screen_pos = camera.world_to_screen(ship.position)
-            if screen_pos is None:
+            candidates.append(ship)
+        if not candidates:
+            return
+        # Project every damaged ship in one batched matmul instead of a
+        # scalar world_to_screen call per ship.
+        positions = np.array([ship.position for ship in candidates], dtype=np.float32)
+        screen, valid = camera.world_to_screen_batch(positions)
+        for ship, pos, on_screen in zip(candidates, screen, valid):
+            if not on_screen:
                 continue
-            self._draw_ship_status_pair(screen_pos, ship, viewport_rect)
+            self._draw_ship_status_pair((float(pos[0]), float(pos[1])), ship, viewport_rect)
 
     def _draw_ship_status_pair(
         self, screen_pos: Tuple[float, float], ship: Ship, viewport_rect: pygame.Rect
@@ -1438,11 +1438,14 @@ class UIPanelRenderer:
 
         bounds = self._world_bounds(world)
         visibility: Optional[VisibilityGrid] = getattr(world, "visibility", None)
+        # One affine precomputation covers every entity mapped below.
+        ox, sx, oy, sy = self._minimap_affine(rect, bounds)
 
         for planetoid in world.planetoids:
             if not self._is_position_explored(visibility, planetoid.position):
                 continue
-            center = self._world_to_minimap(planetoid.position, rect, bounds)
+            position = planetoid.position
+            center = (ox + sx * position[0], oy + sy * position[1])
             radius = self._planetoid_radius(planetoid.radius, rect, bounds)
             color = self._planetoid_color(planetoid.controller)
             self._draw_minimap_planetoid(center, radius, color)
@@ -1450,7 +1453,8 @@ class UIPanelRenderer:
         for asteroid in world.asteroids:
             if not self._is_position_explored(visibility, asteroid.position):
                 continue
-            center = self._world_to_minimap(asteroid.position, rect, bounds)
+            position = asteroid.position
+            center = (ox + sx * position[0], oy + sy * position[1])
             radius = self._asteroid_radius(asteroid.radius, rect, bounds)
             color = self._asteroid_color(asteroid.controller)
             self._draw_minimap_asteroid(center, radius, color)
@@ -1467,8 +1471,8 @@ class UIPanelRenderer:
             else:
                 if ship in world.selected_ships:
                     color = self._selected_color
-            point = self._world_to_minimap(ship.position, rect, bounds)
-            self._draw_minimap_dot(point, color)
+            position = ship.position
+            self._draw_minimap_dot((ox + sx * position[0], oy + sy * position[1]), color)
 
         for facility in world.facilities:
             base = facility.host_base
@@ -1479,12 +1483,18 @@ class UIPanelRenderer:
                 if facility is world.selected_facility
                 else self._friendly_color
             )
-            point = self._world_to_minimap(facility.position, rect, bounds)
-            self._draw_minimap_dot(point, color, size=4.0)
+            position = facility.position
+            self._draw_minimap_dot(
+                (ox + sx * position[0], oy + sy * position[1]), color, size=4.0
+            )
 
         for base in world.bases:
-            point = self._world_to_minimap(base.position, rect, bounds)
-            self._draw_minimap_dot(point, self._friendly_color, size=5.0)
+            position = base.position
+            self._draw_minimap_dot(
+                (ox + sx * position[0], oy + sy * position[1]),
+                self._friendly_color,
+                size=5.0,
+            )
 
         self._draw_fog_overlay(world, rect, bounds)
         self._draw_camera_outline(camera, rect, bounds)
@@ -1591,22 +1601,35 @@ class UIPanelRenderer:
         gl.glVertex2f(left, bottom)
         gl.glEnd()
 
+    @staticmethod
+    def _minimap_affine(
+        rect: pygame.Rect, bounds: Tuple[float, float, float, float]
+    ) -> Tuple[float, float, float, float]:
+        """Collapse the minimap mapping to ``x' = ox + sx*x, y' = oy + sy*y``.
+
+        Hoisting the divides and rect lookups out lets the entity loops map
+        each position with two multiply-adds instead of the full transform.
+        """
+
+        min_x, max_x, min_y, max_y = bounds
+        width = max_x - min_x
+        height = max_y - min_y
+        if width <= 0 or height <= 0:
+            return (float(rect.centerx), 0.0, float(rect.centery), 0.0)
+        sx = -rect.width / width
+        sy = -rect.height / height
+        ox = rect.left + rect.width - sx * min_x
+        oy = rect.bottom - sy * min_y
+        return (ox, sx, oy, sy)
+
     def _world_to_minimap(
         self,
         position: Vec2,
         rect: pygame.Rect,
         bounds: Tuple[float, float, float, float],
     ) -> Vec2:
-        min_x, max_x, min_y, max_y = bounds
-        width = max_x - min_x
-        height = max_y - min_y
-        if width <= 0 or height <= 0:
-            return (rect.centerx, rect.centery)
-        normalized_x = (position[0] - min_x) / width
-        normalized_y = (position[1] - min_y) / height
-        x = rect.left + (1.0 - normalized_x) * rect.width
-        y = rect.bottom - normalized_y * rect.height
-        return (x, y)
+        ox, sx, oy, sy = self._minimap_affine(rect, bounds)
+        return (ox + sx * position[0], oy + sy * position[1])
 
     def _planetoid_color(self, controller: str) -> Tuple[float, float, float, float]:
         if controller == "player":